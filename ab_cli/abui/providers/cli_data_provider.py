@@ -7,18 +7,22 @@ to strongly-typed Pydantic models for compatibility with the DataProvider interf
 import contextlib
 import json
 import os
+import queue
 import shlex
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from typing import Any
 
 from ab_cli.abui.providers.data_provider import DataProvider
-from ab_cli.abui.utils.json_utils import extract_json_from_text
+from ab_cli.abui.utils.json_utils import extract_json_from_text, loads
 from ab_cli.api.pagination import PaginatedResult
 from ab_cli.models.agent import (
     Agent,
     AgentCreate,
+    AgentType,
     AgentTypeList,
     AgentUpdate,
     AgentVersion,
@@ -35,6 +39,158 @@ from ab_cli.models.resources import (
     LLMModelList,
 )
 
+# Resources returned when the CLI cannot list them, so the agent forms stay usable
+FALLBACK_MODELS = (
+    LLMModel(
+        id="gpt-4",
+        name="GPT-4",
+        description="OpenAI GPT-4 model",
+        badge="",
+        metadata="",
+        agent_types=["chat", "rag", "tool"],
+        capabilities={},
+        regions=["us-east-1"],
+    ),
+    LLMModel(
+        id="gpt-3.5-turbo",
+        name="GPT-3.5 Turbo",
+        description="OpenAI GPT-3.5 Turbo model",
+        badge="",
+        metadata="",
+        agent_types=["chat", "rag", "tool"],
+        capabilities={},
+        regions=["us-east-1"],
+    ),
+)
+FALLBACK_GUARDRAILS = (
+    GuardrailModel(name="moderation", description="Content moderation"),
+    GuardrailModel(name="pii-detection", description="PII detection"),
+)
+# Realistic agent types matching the API
+FALLBACK_AGENT_TYPES = (
+    AgentType(
+        type="tool",
+        description="Tool agents can perform operations using predefined tools.",
+    ),
+    AgentType(
+        type="rag",
+        description="RAG combines retrieval-based systems with generative AI models.",
+    ),
+    AgentType(
+        type="task",
+        description="Task agents process structured inputs validated against JSON schemas.",
+    ),
+)
+
+
+class _WorkerStoppedError(RuntimeError):
+    """Raised when a request reaches a worker that stopped before the request was sent."""
+
+
+class _CLIWorker:
+    """Long-lived `ab repl` process that runs CLI commands without a new process each.
+
+    Requests and replies are single JSON lines (see ab_cli.cli.repl). Replies are read
+    by a background thread so that a request can time out like subprocess.run does.
+    """
+
+    # Seconds to wait for the first reply, which confirms the worker started
+    STARTUP_TIMEOUT = 30
+
+    def __init__(self, base_cmd: list[str]):
+        """Start the worker process and check that it answers requests.
+
+        Args:
+            base_cmd: CLI command with global options, without the subcommand
+
+        Raises:
+            OSError: If the process cannot be started
+            RuntimeError: If the process does not answer (e.g. an installed `ab` without
+                the repl command)
+        """
+        self.process = subprocess.Popen(
+            [*base_cmd, "repl"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            # Replies can be large (whole agent lists): read them in 64 KB chunks.
+            # Requests are flushed explicitly, so line buffering is not needed.
+            bufsize=65536,
+        )
+        self._replies: queue.Queue[str] = queue.Queue()
+        self._lock = threading.Lock()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+
+        try:
+            self.run(["--version"], timeout=self.STARTUP_TIMEOUT)
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            self.close()
+            raise RuntimeError(f"CLI worker did not start: {e}") from e
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker process is still running."""
+        return self.process.poll() is None
+
+    def _read_replies(self) -> None:
+        """Forward reply lines from the worker to the reply queue until it exits."""
+        assert self.process.stdout is not None
+        for line in self.process.stdout:
+            self._replies.put(line)
+        # Empty string signals that the worker exited
+        self._replies.put("")
+
+    def run(self, cmd_parts: list[str], timeout: float) -> subprocess.CompletedProcess[str]:
+        """Run a CLI command in the worker.
+
+        Args:
+            cmd_parts: Command parts to add after the base CLI command
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Completed process with the command's return code and output
+
+        Raises:
+            _WorkerStoppedError: If the worker is not running (the request was not sent)
+            subprocess.TimeoutExpired: If no reply arrives in time (the worker is stopped)
+            RuntimeError: If the worker fails after the request was sent, when the
+                command may already have run
+        """
+        with self._lock:
+            if not self.running or self.process.stdin is None:
+                raise _WorkerStoppedError("CLI worker is not running")
+
+            try:
+                self.process.stdin.write(json.dumps(cmd_parts) + "\n")
+                self.process.stdin.flush()
+                line = self._replies.get(timeout=timeout)
+            except queue.Empty as e:
+                self.close()
+                raise subprocess.TimeoutExpired(cmd_parts, timeout) from e
+            except OSError as e:
+                self.close()
+                raise RuntimeError(f"CLI worker failed while sending the request: {e}") from e
+
+            if not line:
+                raise RuntimeError("CLI worker exited without replying")
+
+            try:
+                reply = loads(line)
+                return subprocess.CompletedProcess(
+                    cmd_parts, reply["returncode"], reply["stdout"], reply["stderr"]
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                # The reply stream can no longer be trusted
+                self.close()
+                raise RuntimeError(f"Invalid reply from CLI worker: {line[:200]!r}") from e
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        if self.running:
+            self.process.kill()
+            self.process.wait()
+
 
 class CLIDataProvider(DataProvider):
     """Data provider that uses CLI commands to access data via subprocess.
@@ -43,19 +199,35 @@ class CLIDataProvider(DataProvider):
     as subprocesses, while converting responses to strongly-typed models.
     """
 
-    def __init__(self, config: Any = None, verbose: bool = False, settings: Any = None):
+    # Seconds a cached command result is reused. Results must expire even if nobody
+    # presses Refresh, so that changes made elsewhere show up.
+    CACHE_TTL = 300
+
+    def __init__(
+        self,
+        config: Any = None,
+        verbose: bool = False,
+        settings: Any = None,
+        use_worker: bool = True,
+    ):
         """Initialize with configuration and verbose flag.
 
         Args:
             config: Configuration object with necessary settings (deprecated, use settings)
             verbose: Whether to print verbose debugging output
             settings: Settings object from session state (preferred, includes profile info)
+            use_worker: Whether to run commands in a long-lived `ab repl` process instead
+                of starting a new process per command
         """
         # Prefer settings over config for consistency with DirectDataProvider
         self.settings = settings if settings is not None else config
         self.config = self.settings  # Backward compatibility
         self.verbose = verbose if verbose is not None else False
-        self.cache: dict[str, Any] = {}
+        # Command line -> (time stored, parsed result)
+        self.cache: dict[str, tuple[float, Any]] = {}
+        self.use_worker = use_worker
+        self._worker: _CLIWorker | None = None
+        self._worker_lock = threading.Lock()
 
         # Extract profile if available
         self.profile: str | None = None
@@ -90,81 +262,157 @@ class CLIDataProvider(DataProvider):
         """
         # Check cache first
         cache_key = " ".join(cmd_parts)
-        if use_cache and cache_key in self.cache:
+        cached = self.cache.get(cache_key) if use_cache else None
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL:
             if self.verbose:
                 print(f"Using cached result for: {cache_key}")
-            return self.cache[cache_key]
-
-        # Add common options
-        cmd = ["ab"]
-
-        if self.verbose:
-            cmd.append("--verbose")
-
-        # Add config path if available
-        if self.config_path:
-            cmd.extend(["--config", self.config_path])
+            return cached[1]
 
-        # Add profile if available (must come after --config)
-        if self.profile:
-            cmd.extend(["--profile", self.profile])
-
-        cmd.extend(cmd_parts)
-
-        # Execute command
-        cmd_str = " ".join(shlex.quote(str(part)) for part in cmd)
+        cmd = [*self._base_command(), *cmd_parts]
 
         if self.verbose:
-            print(f"[CLI Provider] Command list: {cmd}", file=sys.stderr)
+            print(f"[CLI Provider] Command: {shlex.join(cmd)}", file=sys.stderr)
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                stdin=subprocess.DEVNULL,
-                check=False,
-            )
+            result = self._run_in_worker(cmd_parts)
+            if result is None:
+                # Execute command directly from the argument list (no intermediate shell)
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                    stdin=subprocess.DEVNULL,
+                    check=False,
+                )
             if self.verbose:
                 print(
                     f"[CLI Provider] Completed with return code: {result.returncode}",
                     file=sys.stderr,
                 )
         except subprocess.TimeoutExpired as e:
-            error_msg = f"Command timed out after 30 seconds: {cmd_str}"
+            error_msg = f"Command timed out after 30 seconds: {shlex.join(cmd)}"
             print(f"[CLI Provider] TIMEOUT: {error_msg}", file=sys.stderr)
             raise RuntimeError(error_msg) from e
         except Exception as e:
-            error_msg = f"Command execution failed: {cmd_str}"
+            error_msg = f"Command execution failed: {shlex.join(cmd)}"
             print(f"[CLI Provider] ERROR: {error_msg} - {str(e)}", file=sys.stderr)
             raise RuntimeError(error_msg) from e
 
+        # Fail fast: the output of a failed command is never parsed
+        if result.returncode != 0:
+            error_msg = f"Command failed with code {result.returncode}: {result.stderr}"
+            if self.verbose:
+                print(error_msg)
+            raise RuntimeError(error_msg)
+
         # Process results
-        if result.returncode == 0:
-            try:
-                data = extract_json_from_text(result.stdout, self.verbose)
+        data = extract_json_from_text(result.stdout, self.verbose)
+        if not data:
+            error_msg = "Command returned empty or invalid JSON"
+            if self.verbose:
+                print(f"[CLI Provider] Error parsing command output: {error_msg}", file=sys.stderr)
+            raise ValueError(error_msg)
 
-                if data:
-                    if use_cache:
-                        self.cache[cache_key] = data
-                    result_dict: dict[str, Any] = data if isinstance(data, dict) else {}
-                    return result_dict
-                else:
-                    raise ValueError("Command returned empty or invalid JSON")
+        if use_cache:
+            self.cache[cache_key] = (time.monotonic(), data)
+        result_dict: dict[str, Any] = data if isinstance(data, dict) else {}
+        return result_dict
+
+    def _base_command(self) -> list[str]:
+        """Build the CLI command with the common options.
+
+        Returns:
+            Command parts up to (not including) the subcommand
+        """
+        cmd = ["ab"]
+
+        if self.verbose:
+            cmd.append("--verbose")
+
+        # Add config path if available
+        if self.config_path:
+            cmd.extend(["--config", self.config_path])
+
+        # Add profile if available (must come after --config)
+        if self.profile:
+            cmd.extend(["--profile", self.profile])
+
+        return cmd
+
+    def _get_worker(self) -> _CLIWorker:
+        """Get the running CLI worker, starting a new one if there is none.
+
+        Returns:
+            The running worker
+
+        Raises:
+            OSError: If the worker process cannot be started
+            RuntimeError: If the worker process does not answer
+        """
+        with self._worker_lock:
+            if self._worker is None or not self._worker.running:
+                self._worker = _CLIWorker(self._base_command())
+            return self._worker
+
+    def _discard_worker(self, worker: _CLIWorker) -> None:
+        """Stop a worker and forget it, so that the next request starts a new one.
+
+        Args:
+            worker: The worker to discard
+        """
+        with self._worker_lock:
+            # Another request may already have replaced it
+            if self._worker is worker:
+                self._worker = None
+        worker.close()
+
+    def _run_in_worker(self, cmd_parts: list[str]) -> subprocess.CompletedProcess[str] | None:
+        """Run a command in the long-lived CLI worker, starting it if needed.
+
+        A worker that stopped (e.g. after a timeout) is replaced on the next request.
+        Once a request has been sent the command is never run again, since commands
+        such as `invoke` or `agents delete` must not run twice.
+
+        Args:
+            cmd_parts: Command parts to add after the base CLI command
+
+        Returns:
+            Completed process, or None if the worker is disabled, cannot be started, or
+            stopped before the request was sent (the caller then runs the command as a
+            separate process)
+
+        Raises:
+            subprocess.TimeoutExpired: If the worker does not reply in time
+            RuntimeError: If the worker fails after the request was sent
+        """
+        if not self.use_worker:
+            return None
+
+        # One retry covers a worker stopped by another request before this one was sent
+        for _attempt in range(2):
+            try:
+                worker = self._get_worker()
             except Exception as e:
-                print(f"[CLI Provider] Error parsing command output: {e}", file=sys.stderr)
+                # e.g. an installed `ab` without the repl command: stop using the worker
+                if self.verbose:
+                    print(f"[CLI Provider] Worker unavailable: {e}", file=sys.stderr)
+                self.use_worker = False
+                return None
+
+            try:
+                return worker.run(cmd_parts, timeout=30)
+            except _WorkerStoppedError:
+                self._discard_worker(worker)
+            except Exception:
+                self._discard_worker(worker)
                 raise
 
-        # Handle errors
-        error_msg = f"Command failed with code {result.returncode}: {result.stderr}"
-        if self.verbose:
-            print(error_msg)
-        raise RuntimeError(error_msg)
+        return None
 
     def clear_cache(self) -> None:
         """Clear the command cache."""
-        self.cache = {}
+        self.cache.clear()
         if self.verbose:
             print("Cache cleared")
 
@@ -453,12 +701,10 @@ class CLIDataProvider(DataProvider):
             InvokeResponse containing the agent's response and metadata.
         """
         try:
-            quoted_message = shlex.quote(message)
-
             if agent_type == "task":
-                cmd = ["invoke", "task", agent_id, "--task", quoted_message, "--format", "json"]
+                cmd = ["invoke", "task", agent_id, "--task", message, "--format", "json"]
             else:
-                cmd = ["invoke", "chat", agent_id, "--message", quoted_message, "--format", "json"]
+                cmd = ["invoke", "chat", agent_id, "--message", message, "--format", "json"]
 
             result = self._run_command(cmd, use_cache=False)
 
@@ -634,30 +880,8 @@ class CLIDataProvider(DataProvider):
             if self.verbose:
                 print(f"Error in get_models: {e}")
             # Fallback
-            fallback_models = [
-                LLMModel(
-                    id="gpt-4",
-                    name="GPT-4",
-                    description="OpenAI GPT-4 model",
-                    badge="",
-                    metadata="",
-                    agent_types=["chat", "rag", "tool"],
-                    capabilities={},
-                    regions=["us-east-1"],
-                ),
-                LLMModel(
-                    id="gpt-3.5-turbo",
-                    name="GPT-3.5 Turbo",
-                    description="OpenAI GPT-3.5 Turbo model",
-                    badge="",
-                    metadata="",
-                    agent_types=["chat", "rag", "tool"],
-                    capabilities={},
-                    regions=["us-east-1"],
-                ),
-            ]
-            pagination = Pagination(limit=limit, offset=offset, total_items=len(fallback_models))
-            return LLMModelList(models=fallback_models, pagination=pagination)
+            pagination = Pagination(limit=limit, offset=offset, total_items=len(FALLBACK_MODELS))
+            return LLMModelList(models=list(FALLBACK_MODELS), pagination=pagination)
 
     def get_guardrails(self, limit: int = 100, offset: int = 0) -> GuardrailList:
         """Get list of available guardrails.
@@ -701,14 +925,10 @@ class CLIDataProvider(DataProvider):
             if self.verbose:
                 print(f"Error in get_guardrails: {e}")
             # Fallback
-            fallback_guardrails = [
-                GuardrailModel(name="moderation", description="Content moderation"),
-                GuardrailModel(name="pii-detection", description="PII detection"),
-            ]
             pagination = Pagination(
-                limit=limit, offset=offset, total_items=len(fallback_guardrails)
+                limit=limit, offset=offset, total_items=len(FALLBACK_GUARDRAILS)
             )
-            return GuardrailList(guardrails=fallback_guardrails, pagination=pagination)
+            return GuardrailList(guardrails=list(FALLBACK_GUARDRAILS), pagination=pagination)
 
     def get_agent_types(self, limit: int = 100, offset: int = 0) -> AgentTypeList:
         """Get list of available agent types.
@@ -728,8 +948,6 @@ class CLIDataProvider(DataProvider):
             pagination_info = result.get("pagination", {})
 
             # Convert to AgentType objects using model_validate
-            from ab_cli.models.agent import AgentType
-
             agent_types = [AgentType.model_validate(at) for at in agent_types_data]
 
             # Create pagination
@@ -744,25 +962,11 @@ class CLIDataProvider(DataProvider):
         except Exception as e:
             if self.verbose:
                 print(f"Error in get_agent_types: {e}")
-            # Fallback to realistic agent types matching API
-            from ab_cli.models.agent import AgentType
-
-            fallback_types = [
-                AgentType(
-                    type="tool",
-                    description="Tool agents can perform operations using predefined tools.",
-                ),
-                AgentType(
-                    type="rag",
-                    description="RAG combines retrieval-based systems with generative AI models.",
-                ),
-                AgentType(
-                    type="task",
-                    description="Task agents process structured inputs validated against JSON schemas.",
-                ),
-            ]
-            pagination = Pagination(limit=limit, offset=offset, total_items=len(fallback_types))
-            return AgentTypeList(agent_types=fallback_types, pagination=pagination)
+            # Fallback
+            pagination = Pagination(
+                limit=limit, offset=offset, total_items=len(FALLBACK_AGENT_TYPES)
+            )
+            return AgentTypeList(agent_types=list(FALLBACK_AGENT_TYPES), pagination=pagination)
 
     def health_check(self) -> bool:
         """Check if the data provider is healthy.
@@ -27,6 +27,10 @@ class DataProvider(ABC):
     This ensures type safety and consistency across different provider implementations.
     """
 
+    # Key identifying the data the provider serves in Streamlit caches. The provider
+    # factory sets it to a digest of the provider's type and configuration.
+    cache_key: str | None = None
+
     # ==================== Agent Operations ====================
 
     @abstractmethod
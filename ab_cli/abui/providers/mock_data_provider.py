@@ -80,7 +80,7 @@ class MockDataProvider(DataProvider):
 
     def clear_cache(self) -> None:
         """Clear the data cache."""
-        self.cache = {}
+        self.cache.clear()
         if self.verbose:
             print("Cache cleared")
 
@@ -1,5 +1,7 @@
 """Factory for creating data providers."""
 
+import hashlib
+import json
 import os
 from typing import Any
 
@@ -11,10 +13,112 @@ from ab_cli.abui.providers.direct_data_provider import DirectDataProvider
 from ab_cli.abui.providers.mock_data_provider import MockDataProvider
 
 
+def _config_cache_key(config: Any, settings: Any, profile: str | None) -> str:
+    """Build a hashable digest of the configuration a provider is created from.
+
+    Args:
+        config: Application configuration
+        settings: Settings from session state (may be None)
+        profile: Active configuration profile (may be None)
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    parts = []
+    for obj in (config, settings):
+        if hasattr(obj, "model_dump_json"):
+            parts.append(obj.model_dump_json())
+        else:
+            parts.append(json.dumps(obj, sort_keys=True, default=str))
+    parts.append(profile or "")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
+def _create_shared_provider(
+    provider_type: str,
+    config_key: str,  # noqa: ARG001 - only used as part of the cache key
+    verbose: bool,
+    _config: Any,
+    _settings: Any,
+) -> DataProvider:
+    """Create a data provider, shared across sessions with the same configuration.
+
+    Args:
+        provider_type: Provider type ("mock" or "direct")
+        config_key: Digest of the configuration, see _config_cache_key
+        verbose: Whether to print verbose output
+        _config: Application configuration (not hashed by Streamlit)
+        _settings: Settings from session state (not hashed by Streamlit)
+
+    Returns:
+        DataProvider instance
+    """
+    return _create_provider(provider_type, verbose, _config, _settings)
+
+
+def _create_provider(provider_type: str, verbose: bool, config: Any, settings: Any) -> DataProvider:
+    """Create a data provider.
+
+    Args:
+        provider_type: Provider type ("mock", "cli" or "direct")
+        verbose: Whether to print verbose output
+        config: Application configuration
+        settings: Settings from session state (may be None)
+
+    Returns:
+        DataProvider instance
+    """
+    provider: DataProvider
+    if provider_type == "mock":
+        if verbose:
+            print("Using Mock data provider")
+        provider = MockDataProvider(config)
+    elif provider_type == "cli":
+        if verbose:
+            print("Using CLI data provider (subprocess-based)")
+            if settings:
+                print("  → Initializing CLIDataProvider with settings from session state")
+                print(f"  → API Endpoint: {settings.api_endpoint}")
+                print(f"  → Client ID: {settings.client_id}")
+            else:
+                print("  → Initializing CLIDataProvider without settings (will load from config)")
+        provider = CLIDataProvider(config, verbose, settings=settings)
+    elif provider_type == "direct":
+        if verbose:
+            print("Using Direct data provider (service layer, no subprocess)")
+            if settings:
+                print("  → Initializing DirectDataProvider with settings from session state")
+                print(f"  → API Endpoint: {settings.api_endpoint}")
+                print(f"  → Client ID: {settings.client_id}")
+            else:
+                print(
+                    "  → Initializing DirectDataProvider without settings (will load from config)"
+                )
+        provider = DirectDataProvider(settings=settings)
+    else:
+        # Default to direct provider
+        if verbose:
+            print(f"Unknown provider type '{provider_type}', defaulting to Direct provider")
+            if settings:
+                print("  → Initializing DirectDataProvider with settings from session state")
+                print(f"  → API Endpoint: {settings.api_endpoint}")
+                print(f"  → Client ID: {settings.client_id}")
+            else:
+                print(
+                    "  → Initializing DirectDataProvider without settings (will load from config)"
+                )
+        provider = DirectDataProvider(settings=settings)
+
+    return provider
+
+
 def get_data_provider(config: Any) -> DataProvider:
     """Get the appropriate data provider based on configuration.
 
-    Provider instance is cached in session state to preserve cache across reruns.
+    Mock and direct providers are shared across sessions with the same configuration
+    through st.cache_resource. Every provider is cached in session state to preserve
+    it across reruns.
 
     Args:
         config: Application configuration
@@ -72,55 +176,26 @@ def get_data_provider(config: Any) -> DataProvider:
         print(f"Data provider type from config: {provider_type}")
         st.session_state.provider_logged = True
 
-    # Create provider instance
-    provider: DataProvider
-    if provider_type.lower() == "mock":
-        if verbose:
-            print("Using Mock data provider")
-        provider = MockDataProvider(config)
-    elif provider_type.lower() == "cli":
-        if verbose:
-            print("Using CLI data provider (subprocess-based)")
-        # Pass settings from session state if available (for profile support)
-        settings = st.session_state.get("settings") if hasattr(st, "session_state") else None
-        if verbose:
-            if settings:
-                print("  → Initializing CLIDataProvider with settings from session state")
-                print(f"  → API Endpoint: {settings.api_endpoint}")
-                print(f"  → Client ID: {settings.client_id}")
-            else:
-                print("  → Initializing CLIDataProvider without settings (will load from config)")
-        provider = CLIDataProvider(config, verbose, settings=settings)
-    elif provider_type.lower() == "direct":
-        if verbose:
-            print("Using Direct data provider (service layer, no subprocess)")
-        # Pass settings from session state if available (for profile support)
-        settings = st.session_state.get("settings") if hasattr(st, "session_state") else None
-        if verbose:
-            if settings:
-                print("  → Initializing DirectDataProvider with settings from session state")
-                print(f"  → API Endpoint: {settings.api_endpoint}")
-                print(f"  → Client ID: {settings.client_id}")
-            else:
-                print(
-                    "  → Initializing DirectDataProvider without settings (will load from config)"
-                )
-        provider = DirectDataProvider(settings=settings)
+    settings = st.session_state.get("settings") if hasattr(st, "session_state") else None
+    profile = st.session_state.get("current_profile") if hasattr(st, "session_state") else None
+    provider_type = provider_type.lower()
+    config_key = _config_cache_key(config, settings, profile)
+
+    if provider_type == "cli":
+        # The CLI provider keeps a worker process, whose requests run one at a time, and
+        # a command cache cleared by Refresh, so each session gets its own
+        provider = _create_provider(provider_type, bool(verbose), config, settings)
     else:
-        # Default to direct provider
-        if verbose:
-            print(f"Unknown provider type '{provider_type}', defaulting to Direct provider")
-        settings = st.session_state.get("settings") if hasattr(st, "session_state") else None
-        if verbose:
-            if settings:
-                print("  → Initializing DirectDataProvider with settings from session state")
-                print(f"  → API Endpoint: {settings.api_endpoint}")
-                print(f"  → Client ID: {settings.client_id}")
-            else:
-                print(
-                    "  → Initializing DirectDataProvider without settings (will load from config)"
-                )
-        provider = DirectDataProvider(settings=settings)
+        # Mock and direct providers only hold the configuration they are built from (the
+        # API client authenticates with the configured credentials), so one instance per
+        # (type, configuration, profile) is shared across sessions
+        provider = _create_shared_provider(
+            provider_type, config_key, bool(verbose), config, settings
+        )
+
+    # Providers of the same type and configuration serve the same data, so cached
+    # lookups (see ab_cli.abui.utils.data_cache) are keyed on the configuration
+    provider.cache_key = f"{provider_type}:{config_key}"
 
     # Cache provider instance in session state
     st.session_state.data_provider = provider
@@ -0,0 +1,74 @@
+"""On-disk chat history for the Agent Builder UI.
+
+Each agent's conversation is saved as a JSON Lines file named after the agent ID,
+with one message per line.
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from ab_cli.abui.utils.json_utils import loads
+from ab_cli.utils.jsonl_handler import write_jsonl_line
+
+
+def history_path(directory: str | Path, agent_id: str) -> Path:
+    """Get the file holding an agent's saved chat history.
+
+    Args:
+        directory: Directory where chat histories are saved
+        agent_id: ID of the agent
+
+    Returns:
+        Path of the agent's JSON Lines history file
+    """
+    return Path(directory).expanduser() / f"{agent_id}.jsonl"
+
+
+def append_message(directory: str | Path, agent_id: str, message: dict[str, Any]) -> None:
+    """Append a message to an agent's saved chat history.
+
+    Only the new message is written, so saving costs the same however long the
+    conversation already is.
+
+    Args:
+        directory: Directory where chat histories are saved
+        agent_id: ID of the agent
+        message: Message dictionary with role, content, and optional metadata
+
+    Raises:
+        OSError: If the history file cannot be written
+        TypeError: If the message is not JSON serializable
+    """
+    path = history_path(directory, agent_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        write_jsonl_line(f, message)
+
+
+def load_messages(directory: str | Path, agent_id: str, limit: int) -> list[dict[str, Any]]:
+    """Load the most recent messages of an agent's saved chat history.
+
+    The file is read line by line into a bounded deque, so only the last `limit`
+    messages are kept in memory and parsed.
+
+    Args:
+        directory: Directory where chat histories are saved
+        agent_id: ID of the agent
+        limit: Maximum number of messages to load
+
+    Returns:
+        The last `limit` messages, oldest first (empty if nothing was saved)
+
+    Raises:
+        OSError: If the history file cannot be read
+        json.JSONDecodeError: If one of the loaded lines is not valid JSON
+    """
+    path = history_path(directory, agent_id)
+    if not path.exists():
+        return []
+
+    with open(path, encoding="utf-8") as f:
+        lines = deque((line for line in f if line.strip()), maxlen=limit)
+
+    return [loads(line) for line in lines]
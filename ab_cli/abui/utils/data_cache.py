@@ -0,0 +1,185 @@
+"""Cached data provider lookups shared by the UI views.
+
+Streamlit caches the results per provider (see provider_cache_key), so reruns and
+other views showing the same data do not call the provider again.
+"""
+
+import uuid
+
+import streamlit as st
+
+from ab_cli.abui.providers.data_provider import DataProvider
+from ab_cli.api.pagination import PaginatedResult
+from ab_cli.models.agent import Agent
+
+
+def clear_cache() -> None:
+    """Clear the data provider cache."""
+    # Get data provider from session state
+    if "data_provider" in st.session_state:
+        st.session_state.data_provider.clear_cache()
+
+    # Forget the agent configuration reused by the agent details page
+    st.session_state.pop("_last_fetched_agent", None)
+
+    # Also clear any Streamlit cache
+    st.cache_data.clear()
+
+
+def provider_cache_key(provider: DataProvider) -> str:
+    """Get the cache key identifying the data a provider serves.
+
+    Streamlit cannot hash provider objects, so cached fetches take the provider as an
+    unhashed argument and use this key to keep results from different providers apart.
+    Providers from the factory carry a digest of their configuration; any other
+    provider is given a random key, which unlike id() is never reused by a later one.
+
+    Args:
+        provider: The data provider instance
+
+    Returns:
+        Key of the provider's data
+    """
+    if provider.cache_key is None:
+        provider.cache_key = f"{type(provider).__name__}:{uuid.uuid4().hex}"
+    return provider.cache_key
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_agents_page(
+    _provider: DataProvider,
+    provider_key: str,  # noqa: ARG001 - only used as part of the cache key
+    limit: int,
+    offset: int,
+) -> PaginatedResult:
+    """Fetch a page of agents, cached per provider and page.
+
+    Args:
+        _provider: Data provider to fetch from (not hashed by Streamlit)
+        provider_key: Cache key of the provider, see provider_cache_key
+        limit: Maximum number of agents to return
+        offset: Number of agents to skip
+
+    Returns:
+        PaginatedResult with agents list and metadata
+    """
+    return _provider.get_agents_paginated(limit=limit, offset=offset)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_agents(
+    _provider: DataProvider,
+    provider_key: str,  # noqa: ARG001 - only used as part of the cache key
+) -> list[Agent]:
+    """Fetch all agents, cached per provider."""
+    return _provider.get_agents()
+
+
+def get_agents() -> list[Agent]:
+    """Get the list of all agents using the data provider.
+
+    Returns:
+        List of Agent model objects
+    """
+    # Get data provider from session state
+    provider = st.session_state.get("data_provider")
+    if not provider:
+        return []
+
+    return _fetch_agents(provider, provider_cache_key(provider))
+
+
+@st.cache_data(ttl=600, show_spinner="Loading models...")
+def _fetch_model_ids(
+    _provider: DataProvider,
+    provider_key: str,  # noqa: ARG001 - only used as part of the cache key
+) -> list[str]:
+    """Fetch the available model IDs, cached per provider."""
+    # Extract model IDs from LLMModelList
+    return [model.id for model in _provider.get_models().models]
+
+
+@st.cache_data(ttl=600, show_spinner="Loading guardrails...")
+def _fetch_guardrail_names(
+    _provider: DataProvider,
+    provider_key: str,  # noqa: ARG001 - only used as part of the cache key
+) -> list[str]:
+    """Fetch the available guardrail names, cached per provider."""
+    # Extract guardrail names from GuardrailList
+    return [guardrail.name for guardrail in _provider.get_guardrails().guardrails]
+
+
+@st.cache_data(ttl=600, show_spinner="Loading agent types...")
+def _fetch_agent_type_names(
+    _provider: DataProvider,
+    provider_key: str,  # noqa: ARG001 - only used as part of the cache key
+) -> list[str]:
+    """Fetch the available agent types, cached per provider."""
+    # Extract type strings from AgentTypeList
+    return [agent_type.type for agent_type in _provider.get_agent_types().agent_types]
+
+
+def get_models() -> list[str]:
+    """Get the list of available models using the data provider.
+
+    Returns:
+        List of model IDs
+    """
+    # Get data provider from session state
+    provider = st.session_state.get("data_provider")
+    if not provider:
+        return []
+
+    return _fetch_model_ids(provider, provider_cache_key(provider))
+
+
+def get_guardrails() -> list[str]:
+    """Get the list of available guardrails using the data provider.
+
+    Returns:
+        List of guardrail names
+    """
+    # Get data provider from session state
+    provider = st.session_state.get("data_provider")
+    if not provider:
+        return []
+
+    return _fetch_guardrail_names(provider, provider_cache_key(provider))
+
+
+def get_agent_types() -> list[str]:
+    """Get the list of available agent types using the data provider.
+
+    Returns:
+        List of agent type strings
+    """
+    # Get data provider from session state
+    provider = st.session_state.get("data_provider")
+    if not provider:
+        return []
+
+    return _fetch_agent_type_names(provider, provider_cache_key(provider))
+
+
+def get_agent_form_options() -> tuple[list[str], list[str], list[str]]:
+    """Get the models, guardrails and agent types offered by the agent form.
+
+    The lookups run one after another on the script thread: the CLI provider's
+    worker runs requests one at a time, so threads would not overlap them, and
+    Streamlit spinners belong on the script thread. Each lookup is cached, so
+    only the first form load pays for them.
+
+    Returns:
+        Tuple of (model IDs, guardrail names, agent type strings)
+    """
+    # Get data provider from session state
+    provider = st.session_state.get("data_provider")
+    if not provider:
+        return [], [], []
+
+    provider_key = provider_cache_key(provider)
+    return (
+        _fetch_model_ids(provider, provider_key),
+        _fetch_guardrail_names(provider, provider_key),
+        _fetch_agent_type_names(provider, provider_key),
+    )
@@ -1,8 +1,39 @@
 """JSON utility functions for the Agent Builder UI."""
 
 import json
+import re
+from types import ModuleType
 from typing import Any, cast
 
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is an optional speedup (the "fast" extra)
+    _orjson = None
+
+# Characters that can start a JSON object or array
+_JSON_START = re.compile(r"[{\[]")
+
+_DECODER = json.JSONDecoder()
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        text: JSON document
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's error is a
+            subclass of it)
+    """
+    if _orjson is not None:
+        return _orjson.loads(text)
+    return json.loads(text)
+
 
 def extract_json_from_text(text: str, verbose: bool = False) -> dict[str, Any] | None:
     """Extract JSON content from text that might include non-JSON content.
@@ -21,7 +52,7 @@ def extract_json_from_text(text: str, verbose: bool = False) -> dict[str, Any] |
 
     # First try direct parsing
     try:
-        return cast(dict[str, Any], json.loads(text))
+        return cast(dict[str, Any], loads(text))
     except json.JSONDecodeError:
         if verbose:
             print("Direct JSON parsing failed, trying to extract JSON content")
@@ -29,80 +60,39 @@ def extract_json_from_text(text: str, verbose: bool = False) -> dict[str, Any] |
             print(text)
             print("##########")
 
-    # Find all potential JSON objects in the text by finding all { and } pairs
-    # We'll try to parse each complete JSON object, preferring those at the end
-    potential_jsons: list[tuple[int, str]] = []
-
-    # Find all starting positions of { or [
-    json_starts = []
-    for i, c in enumerate(text):
-        if c in "{[":
-            json_starts.append((i, c))
+    # Decode a JSON value at each { or [ with the stdlib decoder, which handles strings
+    # and escapes. Starts inside an already decoded value are skipped: nested values are
+    # never preferred over the value that contains them.
+    parsed_jsons: list[tuple[int, int, Any]] = []
+    decoded_end = 0
 
-    if not json_starts:
-        if verbose:
-            print("No JSON markers found in the text")
-        return None
-
-    # For each start position, try to find the matching end
-    for start_idx, _start_char in json_starts:
-        possible_json = text[start_idx:]
-        stack = []
-        json_end = -1
-
-        # Track brackets/braces to find balanced JSON
-        for i, c in enumerate(possible_json):
-            if c in "{[":
-                stack.append(c)
-            elif c == "}" and stack and stack[-1] == "{" or c == "]" and stack and stack[-1] == "[":
-                stack.pop()
-                if not stack:
-                    json_end = i + 1
-                    break
-
-        if json_end > 0:
-            json_str = possible_json[:json_end]
-            potential_jsons.append((start_idx, json_str))
-
-    if not potential_jsons:
-        if verbose:
-            print("No complete JSON objects found")
-        return None
-
-    # Try parsing all potential JSON objects and find the best one
-    # Prefer: 1) Later in text (likely CLI output), 2) Larger size (outer objects vs nested)
-    parsed_jsons = []
-    for start_pos, json_str in potential_jsons:
+    for match in _JSON_START.finditer(text):
+        start_pos = match.start()
+        if start_pos < decoded_end:
+            continue
         try:
-            parsed = json.loads(json_str)
-            # Store: (start_position, length, parsed_object)
-            parsed_jsons.append((start_pos, len(json_str), parsed))
-            if verbose:
-                print(f"Successfully parsed JSON at position {start_pos}, length {len(json_str)}")
+            parsed, decoded_end = _DECODER.raw_decode(text, start_pos)
         except json.JSONDecodeError:
-            if verbose:
-                print(f"Failed to parse JSON at position {start_pos}")
             continue
 
+        # Store: (length, start_position, parsed_object)
+        parsed_jsons.append((decoded_end - start_pos, start_pos, parsed))
+        if verbose:
+            print(
+                f"Successfully parsed JSON at position {start_pos}, length {decoded_end - start_pos}"
+            )
+
     if not parsed_jsons:
         if verbose:
             print("No valid JSON could be parsed")
         return None
 
-    # Sort by: 1) Size descending (prefer larger/outer objects), 2) Position descending (prefer later)
-    # This ensures we get the outermost JSON object that appears latest in the text
-    parsed_jsons.sort(key=lambda x: (x[1], x[0]), reverse=True)
-
-    selected = parsed_jsons[0]
-    if verbose:
-        print(f"Selected JSON at position {selected[0]}, length {selected[1]}")
-
-    return cast(dict[str, Any], selected[2])
-
+    # Prefer: 1) Larger size (outer objects vs nested), 2) Later in text (likely CLI output)
+    length, start_pos, selected = max(parsed_jsons, key=lambda x: (x[0], x[1]))
     if verbose:
-        print("All JSON parsing attempts failed")
+        print(f"Selected JSON at position {start_pos}, length {length}")
 
-    return None
+    return cast(dict[str, Any], selected)
 
 
 def extract_text_from_object(obj: Any) -> str:
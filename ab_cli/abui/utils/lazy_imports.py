@@ -0,0 +1,18 @@
+"""Lazy loaders for heavy optional imports used by the Agent Builder UI."""
+
+import importlib
+from functools import cache
+from types import ModuleType
+
+
+@cache
+def get_pandas() -> ModuleType:
+    """Import pandas on first use and return the module.
+
+    Pages only need pandas when they actually render a table, so the import is
+    deferred until then instead of being paid when the view module is loaded.
+
+    Returns:
+        The pandas module
+    """
+    return importlib.import_module("pandas")
@@ -1,10 +1,55 @@
 """Agent details page for the Agent Builder UI."""
 
 import time
+from typing import Any
 
 import streamlit as st
 
 from ab_cli.abui.providers.provider_factory import get_data_provider
+from ab_cli.abui.utils.lazy_imports import get_pandas
+
+# RAG parameters shown in the RAG Configuration section, with their display labels
+RAG_PARAM_LABELS = {
+    "adjacentEmbeddingRange": "Adjacent Embedding Range",
+    "adjacentEmbeddingMerge": "Adjacent Embedding Merge",
+    "limit": "Chunk Limit",
+    "rerankerEnabled": "Reranker Enabled",
+    "rerankerTopN": "Reranker Top N",
+}
+
+# Fields rendered in their own section and excluded from "Additional Configuration"
+DISPLAYED_CONFIG_FIELDS = (
+    "llmModelId",
+    "systemPrompt",
+    "guardrails",
+    "tools",
+    "inferenceConfig",
+    "inputSchema",
+    *RAG_PARAM_LABELS,
+)
+
+
+@st.cache_data(show_spinner=False)
+def _split_agent_config(agent_config: dict) -> tuple[str, dict[str, Any]]:
+    """Split an agent configuration into RAG markdown and remaining fields.
+
+    Cached on the configuration content so reruns showing the same agent skip the work.
+
+    Args:
+        agent_config: The agent configuration dictionary
+
+    Returns:
+        Tuple of (RAG parameters as markdown, or "" if none, configuration not shown elsewhere)
+    """
+    rag_markdown = "  \n".join(
+        f"**{label}:** {agent_config[key]}"
+        for key, label in RAG_PARAM_LABELS.items()
+        if key in agent_config
+    )
+    remaining_config = {
+        key: value for key, value in agent_config.items() if key not in DISPLAYED_CONFIG_FIELDS
+    }
+    return rag_markdown, remaining_config
 
 
 def display_agent_config(agent_config: dict, verbose: bool = False) -> None:
@@ -14,6 +59,9 @@ def display_agent_config(agent_config: dict, verbose: bool = False) -> None:
         agent_config: The agent configuration dictionary
         verbose: Whether to print verbose debugging output
     """
+    if not agent_config:
+        return
+
     # Debug output
     if verbose:
         print(f"Agent config keys: {list(agent_config.keys())}")
@@ -25,7 +73,6 @@ def display_agent_config(agent_config: dict, verbose: bool = False) -> None:
     if "llmModelId" in agent_config:
         st.markdown("#### Model")
         st.info(agent_config["llmModelId"])
-        # st.markdown("---")
 
     if "systemPrompt" in agent_config:
         st.markdown("#### System Prompt")
@@ -36,14 +83,12 @@ def display_agent_config(agent_config: dict, verbose: bool = False) -> None:
             disabled=True,
             label_visibility="collapsed",
         )
-        # st.markdown("---")
 
     # Display guardrails if available
     if "guardrails" in agent_config and agent_config["guardrails"]:
         st.markdown("#### Guardrails")
         for guardrail in agent_config["guardrails"]:
             st.markdown(f"- {guardrail}")
-        # st.markdown("---")
 
     # Display tools as JSON if available
     if "tools" in agent_config:
@@ -53,65 +98,104 @@ def display_agent_config(agent_config: dict, verbose: bool = False) -> None:
             st.json(tools)
         else:  # If tools is empty
             st.info("No tools configured for this agent")
-        # st.markdown("---")
 
     # Display inferenceConfig as JSON
     if "inferenceConfig" in agent_config:
         st.markdown("#### Inference Configuration")
         st.json(agent_config["inferenceConfig"])
-        # st.markdown("---")
 
     # Display inputSchema if available (for task agents)
     if "inputSchema" in agent_config:
         st.markdown("#### Input Schema")
         st.json(agent_config["inputSchema"])
-        # st.markdown("---")
+
+    rag_markdown, remaining_config = _split_agent_config(agent_config)
 
     # Display RAG configuration parameters if available
-    rag_params = {}
-    if "adjacentEmbeddingRange" in agent_config:
-        rag_params["Adjacent Embedding Range"] = agent_config["adjacentEmbeddingRange"]
-    if "adjacentEmbeddingMerge" in agent_config:
-        rag_params["Adjacent Embedding Merge"] = agent_config["adjacentEmbeddingMerge"]
-    if "limit" in agent_config:
-        rag_params["Chunk Limit"] = agent_config["limit"]
-    if "rerankerEnabled" in agent_config:
-        rag_params["Reranker Enabled"] = agent_config["rerankerEnabled"]
-    if "rerankerTopN" in agent_config:
-        rag_params["Reranker Top N"] = agent_config["rerankerTopN"]
-
-    if rag_params:
+    if rag_markdown:
         st.markdown("#### RAG Configuration")
-        for key, value in rag_params.items():
-            st.markdown(f"**{key}:** {value}")
-        st.markdown("---")
-
-    # Create a copy of the config without the fields we've already displayed
-    remaining_config = agent_config.copy()
-    fields_to_remove = [
-        "llmModelId",
-        "systemPrompt",
-        "guardrails",
-        "tools",
-        "inferenceConfig",
-        "inputSchema",
-        "adjacentEmbeddingRange",
-        "adjacentEmbeddingMerge",
-        "limit",
-        "rerankerEnabled",
-        "rerankerTopN",
-    ]
-    for field in fields_to_remove:
-        if field in remaining_config:
-            del remaining_config[field]
+        st.markdown(rag_markdown)
 
     # Display remaining configuration if anything is left
     if remaining_config:
+        if rag_markdown:
+            st.divider()
         st.markdown("#### Additional Configuration")
         st.json(remaining_config)
 
 
-# extract_json_from_text is now imported from utils
+def _format_version_row(version: Any) -> dict[str, Any]:
+    """Format a version as a row of the versions table.
+
+    Args:
+        version: Version model to format
+
+    Returns:
+        Dictionary of column name to display value
+    """
+    created_at = getattr(version, "created_at", None) or "N/A"
+    if len(str(created_at)) > 10:
+        created_at = str(created_at)[:10]
+
+    # Truncate notes if too long
+    notes = getattr(version, "notes", None) or ""
+    if len(notes) > 50:
+        notes = notes[:47] + "..."
+
+    return {
+        "Number": version.number,
+        "Label": version.version_label or "-",
+        "Notes": notes or "-",
+        "Created": created_at,
+        "Created By": getattr(version, "created_by", None) or "N/A",
+        "Version ID": str(version.id),
+    }
+
+
+def _get_agent_with_config(provider: Any, agent_to_view: Any, agent_id: str) -> Any | None:
+    """Return the agent as an AgentVersion with its configuration.
+
+    The Edit button and the Configuration tab both need the full configuration.
+    If the agent being viewed already carries it, it is returned as-is. Otherwise the
+    last fetched agent is reused when it matches, and only then is the agent fetched
+    (behind a spinner). Fetched agents are stored back in session state so later
+    reruns reuse them.
+
+    Args:
+        provider: Data provider used to fetch the agent
+        agent_to_view: Agent or AgentVersion currently being viewed
+        agent_id: ID of the agent
+
+    Returns:
+        AgentVersion with configuration, or None if the provider returned nothing
+    """
+    if hasattr(agent_to_view, "version") and agent_to_view.version and agent_to_view.version.config:
+        return agent_to_view
+
+    # Reuse the previous fetch (e.g. when coming back to an agent from the chat page)
+    agent_data = st.session_state.get("_last_fetched_agent")
+    if agent_data is None or str(agent_data.agent.id) != agent_id:
+        with st.spinner("Fetching agent configuration..."):
+            agent_data = provider.get_agent(agent_id)
+
+    if agent_data:
+        # Store in the session state for future reference
+        st.session_state.update({"agent_to_view": agent_data, "_last_fetched_agent": agent_data})
+
+    return agent_data
+
+
+@st.fragment
+def _show_statistics_placeholder() -> None:
+    """Display the Statistics tab placeholder.
+
+    The content is static, so it is rendered as a fragment that takes no inputs.
+    """
+    st.markdown("### Agent Statistics")
+
+    # Display information about statistics feature being unavailable
+    st.warning("Agent statistics functionality is not yet implemented in the data provider")
+    st.info("This feature will be available in a future update")
 
 
 def show_agent_details_page() -> None:
@@ -125,17 +209,9 @@ def show_agent_details_page() -> None:
 
     # Check if we have an agent to view
     agent_to_view = st.session_state.get("agent_to_view")
-    if verbose and agent_to_view:
-        # Handle both Agent and AgentVersion types
-        agent_id = agent_to_view.agent.id if hasattr(agent_to_view, "agent") else agent_to_view.id
-        agent_name = (
-            agent_to_view.agent.name if hasattr(agent_to_view, "agent") else agent_to_view.name
-        )
-        print(f"  agent_to_view: {agent_id} - {agent_name}")
-    elif verbose:
-        print("  agent_to_view: None")
-
     if not agent_to_view:
+        if verbose:
+            print("  agent_to_view: None")
         st.error("No agent selected for viewing.")
         # Add a button to go back to the agents list
         if st.button("Back to Agents List"):
@@ -154,8 +230,12 @@ def show_agent_details_page() -> None:
 
     provider = st.session_state.data_provider
 
-    # Get agent name for display (handle both Agent and AgentVersion)
-    agent_name = agent_to_view.agent.name if hasattr(agent_to_view, "agent") else agent_to_view.name
+    # Resolve the agent object once (handle both Agent and AgentVersion)
+    agent_obj = agent_to_view.agent if hasattr(agent_to_view, "agent") else agent_to_view
+    agent_id = str(agent_obj.id)
+    agent_name = agent_obj.name
+    if verbose:
+        print(f"  agent_to_view: {agent_id} - {agent_name}")
 
     # Display agent header information
     title_col, json_col, action_col1, action_col2 = st.columns([3, 1, 1, 1])
@@ -166,9 +246,7 @@ def show_agent_details_page() -> None:
     with json_col:
         if st.button("📄 JSON", use_container_width=True):
             # Toggle JSON view in session state
-            if "show_agent_json" not in st.session_state:
-                st.session_state.show_agent_json = False
-            st.session_state.show_agent_json = not st.session_state.show_agent_json
+            st.session_state.show_agent_json = not st.session_state.get("show_agent_json", False)
             st.rerun()
 
     with action_col1:
@@ -177,56 +255,28 @@ def show_agent_details_page() -> None:
             if verbose:
                 print("[DEBUG] Edit button clicked")
 
-            # Check if this is AgentVersion (has config) or just Agent (no config)
-            has_config = (
-                hasattr(agent_to_view, "version")
-                and agent_to_view.version
-                and agent_to_view.version.config
-            )
-
-            if has_config:
-                # AgentVersion with config available
-                st.session_state.agent_to_edit = agent_to_view
-                st.session_state.nav_intent = "EditAgent"
+            try:
+                agent_data = _get_agent_with_config(provider, agent_to_view, agent_id)
+            except Exception as e:
+                st.error(f"Error fetching agent configuration: {e}")
+            else:
+                if not agent_data:
+                    st.error("Failed to get agent configuration")
+                    return
+
+                st.session_state.update({"agent_to_edit": agent_data, "nav_intent": "EditAgent"})
                 if verbose:
                     print("[DEBUG] Set nav_intent to EditAgent")
                     print("[DEBUG] agent_to_edit set with config")
                 time.sleep(0.1)
                 st.rerun()
-            else:
-                # Agent without config - need to fetch
-                with st.spinner("Fetching agent configuration..."):
-                    try:
-                        agent_id = str(
-                            agent_to_view.agent.id
-                            if hasattr(agent_to_view, "agent")
-                            else agent_to_view.id
-                        )
-                        agent_data = provider.get_agent(agent_id)
-
-                        if not agent_data:
-                            st.error("Failed to get agent configuration")
-                            return
-
-                        # Update session state with full AgentVersion data
-                        st.session_state.agent_to_view = agent_data
-                        st.session_state.agent_to_edit = agent_data
-                        st.session_state.nav_intent = "EditAgent"
-                        if verbose:
-                            print("[DEBUG] Setting nav_intent to EditAgent after fetching config")
-                            print("[DEBUG] Set agent_to_edit with fetched config")
-                        time.sleep(0.1)
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error fetching agent configuration: {e}")
 
     with action_col2:
         # Chat button
         if st.button("Chat with Agent", use_container_width=True):
             if verbose:
                 print("[DEBUG] Chat button clicked")
-            st.session_state.selected_agent = agent_to_view
-            st.session_state.nav_intent = "Chat"
+            st.session_state.update({"selected_agent": agent_to_view, "nav_intent": "Chat"})
             if verbose:
                 print("[DEBUG] Set nav_intent to Chat")
             # Give some time for the session state to update
@@ -235,81 +285,62 @@ def show_agent_details_page() -> None:
 
     # Show full agent JSON if toggled
     if st.session_state.get("show_agent_json", False):
-        st.markdown("---")
+        st.divider()
         st.markdown("### Full Agent JSON")
         # Convert Pydantic model to dict for proper JSON serialization
         if hasattr(agent_to_view, "model_dump"):
             st.json(agent_to_view.model_dump())
         else:
             st.json(agent_to_view)
-        st.markdown("---")
+        st.divider()
 
     # Create tabs for different sections
     tabs = st.tabs(["General Info", "Configuration", "Versions", "Statistics"])
 
     # General Info tab
     with tabs[0]:
-        # Get agent object (handle both Agent and AgentVersion)
-        agent_obj = agent_to_view.agent if hasattr(agent_to_view, "agent") else agent_to_view
-
-        # Show agent basic information
-        st.markdown(f"**ID:** `{agent_obj.id}`")
-        st.markdown(f"**Name:** {agent_obj.name}")
-        st.markdown(f"**Type:** {agent_obj.type}")
-        st.markdown(f"**Status:** {agent_obj.status}")
-        if agent_obj.description:
-            st.markdown(f"**Description:** {agent_obj.description}")
-
-        if hasattr(agent_obj, "created_at") and agent_obj.created_at:
-            st.markdown(f"**Created:** {agent_obj.created_at}")
-        if hasattr(agent_obj, "modified_at") and agent_obj.modified_at:
-            st.markdown(f"**Last Modified:** {agent_obj.modified_at}")
+        # Bind the optional fields once instead of re-reading them per line
+        description = agent_obj.description
+        created_at = getattr(agent_obj, "created_at", None)
+        modified_at = getattr(agent_obj, "modified_at", None)
+
+        # Show agent basic information in a single markdown element
+        info_lines = [
+            f"**ID:** `{agent_id}`",
+            f"**Name:** {agent_name}",
+            f"**Type:** {agent_obj.type}",
+            f"**Status:** {agent_obj.status}",
+        ]
+        if description:
+            info_lines.append(f"**Description:** {description}")
+        if created_at:
+            info_lines.append(f"**Created:** {created_at}")
+        if modified_at:
+            info_lines.append(f"**Last Modified:** {modified_at}")
+
+        # Markdown hard line breaks keep one field per line
+        st.markdown("  \n".join(info_lines))
 
     # Configuration tab
     with tabs[1]:
         st.markdown("### Agent Configuration")
 
-        # Check if this is AgentVersion with config
-        agent_config = None
-        if (
-            hasattr(agent_to_view, "version")
-            and agent_to_view.version
-            and agent_to_view.version.config
-        ):
-            agent_config = agent_to_view.version.config
-
-        if agent_config:
-            # Display the configuration in a structured way
-            display_agent_config(agent_config, verbose=verbose)
-        else:
-            # Fetch detailed agent information including configuration
-            with st.spinner("Fetching agent configuration..."):
-                try:
-                    agent_id = str(
-                        agent_to_view.agent.id
-                        if hasattr(agent_to_view, "agent")
-                        else agent_to_view.id
-                    )
-                    agent_data = provider.get_agent(agent_id)
-
-                    if not agent_data:
-                        st.error("Failed to get agent details")
-                        return
-
-                    # AgentVersion has .version.config
-                    if agent_data.version and agent_data.version.config:
-                        agent_config = agent_data.version.config
+        try:
+            agent_data = _get_agent_with_config(provider, agent_to_view, agent_id)
 
-                        # Store in the session state for future reference
-                        st.session_state.agent_to_view = agent_data
+            if not agent_data:
+                st.error("Failed to get agent details")
+                return
 
-                        # Display the configuration in a structured way
-                        display_agent_config(agent_config, verbose=verbose)
-                    else:
-                        st.warning("Configuration not available in agent data")
+            # AgentVersion has .version.config
+            if agent_data.version and agent_data.version.config:
+                # Display the configuration in a structured way
+                display_agent_config(agent_data.version.config, verbose=verbose)
+            else:
+                st.warning("Configuration not available in agent data")
 
-                except Exception as e:
-                    st.error(f"Error fetching agent configuration: {e}")
+        except Exception as e:
+            st.error(f"Error fetching agent configuration: {e}")
 
     # Versions tab
     with tabs[2]:
@@ -317,9 +348,6 @@ def show_agent_details_page() -> None:
 
         with st.spinner("Loading versions..."):
             try:
-                agent_id = str(
-                    agent_to_view.agent.id if hasattr(agent_to_view, "agent") else agent_to_view.id
-                )
                 versions_data = provider.get_versions(agent_id)
 
                 if not versions_data or not versions_data.versions:
@@ -335,40 +363,11 @@ def show_agent_details_page() -> None:
                     st.info(f"Total versions: {total_versions}")
 
                     # Prepare data for table display
-                    import pandas as pd
-
-                    table_data = []
-                    for version in versions:
-                        created_at = (
-                            version.created_at
-                            if hasattr(version, "created_at") and version.created_at
-                            else "N/A"
-                        )
-                        if created_at and created_at != "N/A" and len(str(created_at)) > 10:
-                            created_at = str(created_at)[:10]
-
-                        # Truncate notes if too long
-                        notes = version.notes if hasattr(version, "notes") and version.notes else ""
-                        if notes and len(notes) > 50:
-                            notes = notes[:47] + "..."
-
-                        table_data.append(
-                            {
-                                "Number": version.number,
-                                "Label": version.version_label if version.version_label else "-",
-                                "Notes": notes if notes else "-",
-                                "Created": created_at,
-                                "Created By": version.created_by
-                                if hasattr(version, "created_by") and version.created_by
-                                else "N/A",
-                                "Version ID": str(version.id),
-                            }
-                        )
-
-                    # Reverse the list to show newest versions first
-                    table_data.reverse()
-
-                    # Display as dataframe
+                    # Newest versions first
+                    table_data = list(map(_format_version_row, reversed(versions)))
+
+                    # Display as dataframe (pandas is only imported once there are rows)
+                    pd = get_pandas()
                     df = pd.DataFrame(table_data)
                     st.dataframe(
                         df,
@@ -385,7 +384,7 @@ def show_agent_details_page() -> None:
                     )
 
                     # Add section to view version details
-                    st.markdown("---")
+                    st.divider()
                     st.markdown("#### View Version Configuration")
 
                     # Dropdown to select version
@@ -423,17 +422,13 @@ def show_agent_details_page() -> None:
 
     # Statistics tab
     with tabs[3]:
-        st.markdown("### Agent Statistics")
-
-        # Display information about statistics feature being unavailable
-        st.warning("Agent statistics functionality is not yet implemented in the data provider")
-        st.info("This feature will be available in a future update")
+        _show_statistics_placeholder()
 
     # Add a button to go back to the agents list
-    st.markdown("---")
+    st.divider()
     if st.button("Back to Agents List"):
-        st.session_state.nav_intent = "Agents"
-        st.session_state.current_page = "Agents"  # Also update current page for consistency
+        # Also update current page for consistency
+        st.session_state.update({"nav_intent": "Agents", "current_page": "Agents"})
         if verbose:
             print("[DEBUG] Back button clicked, setting nav_intent and current_page to Agents")
         # Give some time for the session state to update
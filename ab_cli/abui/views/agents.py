@@ -6,16 +6,50 @@ import streamlit as st
 
 from ab_cli.abui.components.agent_card import agent_card
 from ab_cli.abui.providers.provider_factory import get_data_provider
-
-
-def clear_cache() -> None:
-    """Clear the data provider cache."""
-    # Get data provider from session state
-    if "data_provider" in st.session_state:
-        st.session_state.data_provider.clear_cache()
-
-    # Also clear any Streamlit cache
-    st.cache_data.clear()
+from ab_cli.abui.utils.data_cache import clear_cache, fetch_agents_page, provider_cache_key
+from ab_cli.abui.utils.lazy_imports import get_pandas
+
+
+# CSS to reduce padding and make the agents table more compact
+TABLE_CSS = """
+<style>
+/* Reduce dataframe container padding */
+[data-testid="stDataFrame"] {
+    padding: 0 !important;
+    margin: 0 !important;
+}
+/* Compact dataframe height */
+[data-testid="stDataFrame"] > div {
+    height: 400px !important;
+    max-height: 400px !important;
+}
+</style>
+"""
+
+
+# Agents table columns, those holding plain text, and the low-cardinality ones
+TABLE_COLUMNS = ("ID", "Name", "Type", "Status", "Owner", "Created", "Updated")
+TABLE_TEXT_COLUMNS = ("ID", "Name", "Owner")
+TABLE_CATEGORY_COLUMNS = ("Type", "Status")
+
+# Number of agent cards rendered at once in the card view, and columns of the grid
+CARDS_BATCH_SIZE = 20
+CARD_COLUMNS = 2
+
+# Actions offered for the selected table row, keyed by their label
+TABLE_ACTIONS = {
+    "📋 Copy Full ID": "copy",
+    "👁️ View Details": "view",
+    "✏️ Edit Agent": "edit",
+    "💬 Chat": "chat",
+}
+
+
+def _on_agent_action() -> None:
+    """Record the chosen table action and reset the action widget."""
+    label = st.session_state.agent_action
+    st.session_state.pending_agent_action = TABLE_ACTIONS.get(label) if label else None
+    st.session_state.agent_action = None
 
 
 def show_agents_page() -> None:
@@ -48,8 +82,30 @@ def show_agents_page() -> None:
     show_agent_list()
 
 
+def _reset_card_batches() -> None:
+    """Go back to showing only the first batch of agent cards."""
+    st.session_state.pop("agent_cards_visible", None)
+
+
+def _on_page_change() -> None:
+    """Apply the page number entered in the pagination input."""
+    st.session_state.agents_page = st.session_state.page_input
+    _reset_card_batches()
+
+
+def _refresh_agent_list() -> None:
+    """Clear the cached agents before the list is fetched again."""
+    clear_cache()
+    _reset_card_batches()
+
+
+@st.fragment
 def show_agent_list() -> None:
-    """Display a paginated list of available agents."""
+    """Display a paginated list of available agents.
+
+    Runs as a fragment so that pagination, view-mode and row-selection changes only
+    rerun the list. Buttons that navigate to another page trigger a full app rerun.
+    """
     # Initialize pagination state - use 50 items to match CLI default
     if "agents_page" not in st.session_state:
         st.session_state.agents_page = 1
@@ -59,52 +115,58 @@ def show_agent_list() -> None:
     # Get data provider from session state
     provider = st.session_state.data_provider
 
+    current_page = st.session_state.agents_page
+    page_size = st.session_state.agents_page_size
+
     # Fetch paginated data first (so we have the info for top row)
     try:
-        offset = (st.session_state.agents_page - 1) * st.session_state.agents_page_size
-        result = provider.get_agents_paginated(
-            limit=st.session_state.agents_page_size, offset=offset
-        )
+        offset = (current_page - 1) * page_size
+        result = fetch_agents_page(provider, provider_cache_key(provider), page_size, offset)
 
-        # Calculate pagination info for display
-        total_pages = (
-            (result.total_count + result.limit - 1) // result.limit if result.total_count > 0 else 1
-        )
-        current_page = st.session_state.agents_page
+        # Calculate pagination info for display. The count arrives with the page; when
+        # the provider cannot report it, allow moving one page past a full page.
         start = result.offset + 1
-        end = min(result.offset + result.limit, result.total_count)
+        end = result.offset + len(result.agents)
+        if result.total_count is None:
+            total_label = "many"
+            total_pages = current_page + 1 if result.has_more else current_page
+        else:
+            total_label = str(result.total_count)
+            total_pages = max(1, -(-result.total_count // result.limit))
 
         # Controls row: refresh, view mode, pagination info and navigation
         col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
 
         with col1:
-            if st.button("Refresh Agent List"):
-                # Clear the cache when refreshing
-                clear_cache()
+            # The callback clears the cache before this run fetches the page again
+            if st.button("Refresh Agent List", on_click=_refresh_agent_list):
                 st.success("Cache cleared and agent list refreshed")
 
         with col2:
             # Use segmented_control with icons for view mode toggle
             view_mode = st.segmented_control(
-                label="View Mode:", options=["🗂️ Cards", "📋 Table"], key="agent_view_mode"
+                label="View Mode:",
+                options=["🗂️ Cards", "📋 Table"],
+                key="agent_view_mode",
+                on_change=_reset_card_batches,
             )
 
         with col3:
-            st.caption(f"Showing {start}-{end} of {result.total_count} agents")
+            st.caption(f"Showing {start}-{end} of {total_label} agents")
 
         with col4:
-            # Simple page number input with -/+ buttons
-            page_input = st.number_input(
+            # Simple page number input with -/+ buttons; the callback updates the page
+            # before the rerun Streamlit already performs for the widget change
+            st.number_input(
                 f"Page (1-{total_pages})",
                 min_value=1,
                 max_value=total_pages,
                 value=current_page,
+                step=1,
                 key="page_input",
                 label_visibility="visible",
+                on_change=_on_page_change,
             )
-            if page_input != current_page:
-                st.session_state.agents_page = page_input
-                st.rerun()
 
         if not result.agents:
             st.info("No agents found. Create a new agent to get started.")
@@ -120,68 +182,93 @@ def show_agent_list() -> None:
         st.error(f"Error loading agents: {e}")
 
 
+def _show_more_cards() -> None:
+    """Reveal the next batch of agent cards."""
+    st.session_state.agent_cards_visible = (
+        st.session_state.get("agent_cards_visible", CARDS_BATCH_SIZE) + CARDS_BATCH_SIZE
+    )
+
+
 def display_agents_as_cards(agents: list[Any]) -> None:
     """Display agents in a grid with cards.
 
+    Only the first CARDS_BATCH_SIZE cards are rendered; the rest are revealed in
+    batches on request, so large pages do not build every card widget up front.
+
     Args:
         agents: List of Agent model objects
     """
-    # Display agents in a grid with cards
-    col1, col2 = st.columns(2)
+    visible_count = st.session_state.get("agent_cards_visible", CARDS_BATCH_SIZE)
+    visible = agents[:visible_count]
+
+    # Display agents in a grid with cards: agent i goes to column i % CARD_COLUMNS, and
+    # each column is filled in one go from its slice of the agents
+    columns = st.columns(CARD_COLUMNS)
+
+    for offset, column in enumerate(columns):
+        with column:
+            for agent in visible[offset::CARD_COLUMNS]:
+                # Use our agent card component (pass model directly)
+                agent_card(agent)
+
+    remaining = len(agents) - len(visible)
+    if remaining > 0:
+        st.button(
+            f"Show {min(remaining, CARDS_BATCH_SIZE)} more",
+            key="agent_cards_more",
+            on_click=_show_more_cards,
+        )
 
-    for i, agent in enumerate(agents):
-        with col1 if i % 2 == 0 else col2:
-            # Use our agent card component (pass model directly)
-            agent_card(agent)
 
+@st.cache_data(show_spinner=False)
+def _agents_table(rows: tuple[tuple[Any, ...], ...]) -> Any:
+    """Build the agents table DataFrame, cached on its row values.
 
-def display_agents_as_table(agents: list[Any]) -> None:
-    """Display agents in a clean dataframe table with action buttons."""
-    import pandas as pd
-
-    # Add CSS to reduce padding and make table more compact
-    st.markdown(
-        """
-    <style>
-    /* Reduce dataframe container padding */
-    [data-testid="stDataFrame"] {
-        padding: 0 !important;
-        margin: 0 !important;
-    }
-    /* Compact dataframe height */
-    [data-testid="stDataFrame"] > div {
-        height: 400px !important;
-        max-height: 400px !important;
-    }
-    </style>
-    """,
-        unsafe_allow_html=True,
+    Args:
+        rows: One tuple of TABLE_COLUMNS values per agent
+
+    Returns:
+        pandas DataFrame with the TABLE_COLUMNS columns
+    """
+    pd = get_pandas()
+
+    # Text columns use Arrow-backed strings so st.dataframe can serialize them
+    # without inferring the type of every value. Type and status only take a few
+    # values, so they are stored as categories (small codes plus the distinct values).
+    return pd.DataFrame.from_records(list(rows), columns=TABLE_COLUMNS).astype(
+        dict.fromkeys(TABLE_TEXT_COLUMNS, "string[pyarrow]")
+        | dict.fromkeys(TABLE_CATEGORY_COLUMNS, "category")
     )
 
-    # Prepare data for table (agents are now Pydantic models)
-    table_data = []
-    for agent in agents:
-        # Convert UUID to string for DataFrame compatibility
-        agent_id = str(agent.id)
-
-        table_data.append(
-            {
-                "ID": agent_id,
-                "Name": agent.name,
-                "Type": agent.type,
-                "Status": agent.status,
-                "Created": getattr(agent, "created_at", ""),
-                "Updated": getattr(agent, "modified_at", ""),
-                "Owner": getattr(agent, "modified_by", ""),
-                "_full_id": agent_id,  # Hidden for tooltip
-            }
-        )
 
-    df = pd.DataFrame(table_data)
+def display_agents_as_table(agents: list[Any]) -> None:
+    """Display agents in a clean dataframe table with action buttons."""
+    # Add CSS to reduce padding and make table more compact. It has to be emitted on
+    # every run: elements not re-emitted in a rerun are removed from the page.
+    st.markdown(TABLE_CSS, unsafe_allow_html=True)
+
+    # Build the table from its row values; the DataFrame is cached on those values, so
+    # reruns of the same page (selection, view mode, actions) reuse it
+    df = _agents_table(
+        tuple(
+            (
+                str(agent.id),
+                agent.name,
+                agent.type,
+                agent.status,
+                getattr(agent, "modified_by", ""),
+                getattr(agent, "created_at", ""),
+                getattr(agent, "modified_at", ""),
+            )
+            for agent in agents
+        )
+    )
 
-    # Display dataframe with row selection
+    # Display dataframe with row selection. The key is stable within a page so the
+    # selection survives reruns, and changes with the page to reset it.
     event = st.dataframe(
-        df[["ID", "Name", "Type", "Status", "Owner", "Created", "Updated"]],
+        df,
+        key=f"agents_df_p{st.session_state.get('agents_page', 1)}",
         width="stretch",
         height="stretch",
         hide_index=True,
@@ -198,108 +285,51 @@ def display_agents_as_table(agents: list[Any]) -> None:
         },
     )
 
-    # Determine if a row is selected
-    has_selection = bool(event.selection.rows)  # type: ignore[attr-defined]
+    # Determine if a row is selected. The keyed selection outlives changes to the
+    # page's rows (refresh, deletions), so a row that no longer exists is ignored.
+    rows = event.selection.rows  # type: ignore[attr-defined]
+    has_selection = bool(rows) and rows[0] < len(agents)
     selected_agent = None
     selected_display = "None"
 
     if has_selection:
-        selected_idx = event.selection.rows[0]  # type: ignore[attr-defined]
+        selected_idx = rows[0]
         selected_agent = agents[selected_idx]
-        selected_display = f"{selected_agent.name} ({table_data[selected_idx]['ID']})"
+        selected_display = f"{selected_agent.name} ({df.at[selected_idx, 'ID']})"
 
-    # Always show action buttons, but disabled when no selection
+    # Always show the actions, but disabled when no selection
     st.markdown("---")
     st.markdown(f"**Selected:** {selected_display}")
 
-    # Show action buttons in columns (always visible, disabled when no selection)
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        if (
-            st.button("📋 Copy Full ID", use_container_width=True, disabled=not has_selection)
-            and selected_agent
-        ):
-            full_id = selected_agent.id
-            st.toast(f"ID: {full_id}", icon="📋")
-
-    with col2:
-        if (
-            st.button("👁️ View Details", use_container_width=True, disabled=not has_selection)
-            and selected_agent
-        ):
-            st.session_state.agent_to_view = selected_agent
-            st.session_state.nav_intent = "AgentDetails"
-            st.rerun()
-
-    with col3:
-        if (
-            st.button("✏️ Edit Agent", use_container_width=True, disabled=not has_selection)
-            and selected_agent
-        ):
-            # Fetch full AgentVersion for editing (not just Agent summary)
-            provider = st.session_state.data_provider
-            full_agent = provider.get_agent(str(selected_agent.id))
-            st.session_state.agent_to_edit = full_agent
-            st.session_state.nav_intent = "EditAgent"
-            st.rerun()
-
-    with col4:
-        if (
-            st.button("💬 Chat", use_container_width=True, disabled=not has_selection)
-            and selected_agent
-        ):
-            st.session_state.selected_agent = selected_agent
-            st.session_state.nav_intent = "Chat"
-            st.rerun()
-
-
-def get_models() -> list[str]:
-    """Get the list of available models using the data provider.
-
-    Returns:
-        List of model IDs
-    """
-    # Get data provider from session state
-    provider = st.session_state.get("data_provider")
-    if not provider:
-        return []
-
-    with st.spinner("Loading models..."):
-        models_list = provider.get_models()
-        # Extract model IDs from LLMModelList
-        return [model.id for model in models_list.models]
-
-
-def get_guardrails() -> list[str]:
-    """Get the list of available guardrails using the data provider.
-
-    Returns:
-        List of guardrail names
-    """
-    # Get data provider from session state
-    provider = st.session_state.get("data_provider")
-    if not provider:
-        return []
-
-    with st.spinner("Loading guardrails..."):
-        guardrails_list = provider.get_guardrails()
-        # Extract guardrail names from GuardrailList
-        return [guardrail.name for guardrail in guardrails_list.guardrails]
-
-
-def get_agent_types() -> list[str]:
-    """Get the list of available agent types using the data provider.
+    # All actions share a single pills widget; the callback moves the choice out of
+    # the widget so it does not stay selected (and fire again) on later runs
+    st.pills(
+        "Action",
+        options=list(TABLE_ACTIONS),
+        selection_mode="single",
+        key="agent_action",
+        on_change=_on_agent_action,
+        disabled=not has_selection,
+        label_visibility="collapsed",
+    )
+    action = st.session_state.pop("pending_agent_action", None)
+    if not action or not selected_agent:
+        return
 
-    Returns:
-        List of agent type strings
-    """
-    # Get data provider from session state
-    provider = st.session_state.get("data_provider")
-    if not provider:
-        return []
-
-    with st.spinner("Loading agent types..."):
-        agent_types_list = provider.get_agent_types()
-        # Extract type strings from AgentTypeList
-        return [agent_type.type for agent_type in agent_types_list.agent_types]
+    if action == "copy":
+        st.toast(f"ID: {selected_agent.id}", icon="📋")
+    elif action == "view":
+        st.session_state.agent_to_view = selected_agent
+        st.session_state.nav_intent = "AgentDetails"
+        st.rerun()
+    elif action == "edit":
+        # Fetch full AgentVersion for editing (not just Agent summary)
+        provider = st.session_state.data_provider
+        full_agent = provider.get_agent(str(selected_agent.id))
+        st.session_state.agent_to_edit = full_agent
+        st.session_state.nav_intent = "EditAgent"
+        st.rerun()
+    elif action == "chat":
+        st.session_state.selected_agent = selected_agent
+        st.session_state.nav_intent = "Chat"
+        st.rerun()
@@ -1,20 +1,70 @@
 """Chat page for the Agent Builder UI."""
 
 import json
+from collections.abc import Callable
 from typing import Any, cast
 
 import streamlit as st
+from jsonschema.exceptions import SchemaError
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
+from ab_cli.abui.providers.data_provider import DataProvider
 from ab_cli.abui.providers.provider_factory import get_data_provider
+from ab_cli.abui.utils.chat_history import append_message, load_messages
+from ab_cli.abui.utils.data_cache import clear_cache, get_agents
+from ab_cli.abui.utils.json_utils import loads
+
+# Number of most recent chat messages rendered; older ones are revealed on request
+CHAT_HISTORY_WINDOW = 50
+
+# Factories for the task editor's default value of each JSON schema type
+SCHEMA_TYPE_DEFAULTS: dict[str, Callable[[], Any]] = {
+    "string": str,
+    "number": int,
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def _data_provider() -> DataProvider:
+    """Get the session's data provider, creating it from the configuration on first use."""
+    return get_data_provider(st.session_state.get("config", {}))
+
+
+def _open_chat() -> None:
+    """Open the chat with the agent chosen in the agent picker."""
+    index = st.session_state.get("chat_agent_index")
+    agents = get_agents()
+    if index is not None and index < len(agents):
+        st.session_state.selected_agent = agents[index]
+
+
+def _close_chat() -> None:
+    """Return to the agent selection."""
+    st.session_state.selected_agent = None
+
+
+def _open_agent_page(page: str, state_key: str, agent: Any) -> None:
+    """Navigate to another page showing the given agent.
+
+    Args:
+        page: Page to navigate to
+        state_key: Session state key the page reads its agent from
+        agent: The agent to show
+    """
+    st.session_state[state_key] = agent
+    st.session_state.current_page = page
 
 
 def show_chat_page() -> None:
     """Show the chat interface."""
     st.title("Agent Builder Chat")
 
-    config = st.session_state.get("config", {})
-    data_provider = get_data_provider(config)
-    agents = data_provider.get_agents()
+    # Create the session's data provider before the cached agent list needs it
+    _data_provider()
 
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = {}
@@ -32,26 +82,20 @@ def show_chat_page() -> None:
     if st.session_state.selected_agent is None:
         st.subheader("Select an Agent to Chat With")
 
-        agent_names = [agent.name for agent in agents]
-        agent_ids = [str(agent.id) for agent in agents]
+        # The agent list is cached, so reruns while choosing do not refetch it
+        agents = get_agents()
 
-        selected_index = st.selectbox(
-            "Choose an agent:", range(len(agent_names)), format_func=lambda i: agent_names[i]
+        # The selectbox returns the index of the chosen agent in the list
+        st.selectbox(
+            "Choose an agent:",
+            range(len(agents)),
+            format_func=lambda i: agents[i].name,
+            key="chat_agent_index",
         )
 
-        if st.button("Chat with Agent"):
-            selected_agent = next(
-                (a for a in agents if str(a.id) == agent_ids[selected_index]), None
-            )
-            if selected_agent:
-                st.session_state.selected_agent = selected_agent
-
-                # Initialize chat history for this agent if needed
-                agent_id_str = str(selected_agent.id)
-                if agent_id_str not in st.session_state.chat_history:
-                    st.session_state.chat_history[agent_id_str] = []
-
-                st.rerun()
+        # Buttons act in callbacks, so a click is handled by the rerun it triggers
+        st.button("Chat with Agent", on_click=_open_chat, disabled=not agents)
+        st.button("🔄 Refresh Agents", on_click=clear_cache)
     else:
         # Show chat interface with selected agent
         agent = st.session_state.selected_agent
@@ -61,23 +105,23 @@ def show_chat_page() -> None:
         col1, col2, col3 = st.columns([2, 1, 1])
 
         with col1:
-            if st.button("← Back to Agent Selection"):
-                st.session_state.selected_agent = None
-                st.rerun()
+            st.button("← Back to Agent Selection", on_click=_close_chat)
 
         with col2:
-            if st.button("👁️ View Agent"):
-                # Navigate to agent details view
-                st.session_state.agent_to_view = agent
-                st.session_state.current_page = "AgentDetails"
-                st.rerun()
+            # Navigate to agent details view
+            st.button(
+                "👁️ View Agent",
+                on_click=_open_agent_page,
+                args=("AgentDetails", "agent_to_view", agent),
+            )
 
         with col3:
-            if st.button("✏️ Edit Agent"):
-                # Navigate to edit agent view
-                st.session_state.agent_to_edit = agent
-                st.session_state.current_page = "EditAgent"
-                st.rerun()
+            # Navigate to edit agent view
+            st.button(
+                "✏️ Edit Agent",
+                on_click=_open_agent_page,
+                args=("EditAgent", "agent_to_edit", agent),
+            )
 
         # Display agent tools if available
         display_agent_tools(agent)
@@ -89,68 +133,113 @@ def show_chat_page() -> None:
             show_chat_agent_interface(agent)
 
 
+def _chat_history_dir() -> str | None:
+    """Get the directory where chat histories are saved, or None if saving is disabled."""
+    ui_settings = getattr(st.session_state.get("config"), "ui", None)
+    return getattr(ui_settings, "chat_history_dir", None)
+
+
+def get_chat_history(agent_id: str) -> list[dict[str, Any]]:
+    """Get the session's chat history with an agent.
+
+    On first use in a session, the most recent saved messages are loaded when chat
+    history saving is configured (ui.chat_history_dir).
+
+    Args:
+        agent_id: ID of the agent
+
+    Returns:
+        The agent's message list, shared with session state
+    """
+    histories = st.session_state.chat_history
+    if agent_id not in histories:
+        messages: list[dict[str, Any]] = []
+        directory = _chat_history_dir()
+        if directory:
+            try:
+                messages = load_messages(directory, agent_id, CHAT_HISTORY_WINDOW)
+            except (OSError, ValueError) as e:
+                st.warning(f"Could not load saved chat history: {e}")
+        histories[agent_id] = messages
+    return cast(list[dict[str, Any]], histories[agent_id])
+
+
+def add_chat_message(agent_id: str, message: dict[str, Any]) -> None:
+    """Add a message to the chat history with an agent, saving it when configured.
+
+    Args:
+        agent_id: ID of the agent
+        message: Message dictionary with role, content, and optional metadata
+    """
+    get_chat_history(agent_id).append(message)
+
+    directory = _chat_history_dir()
+    if directory:
+        try:
+            append_message(directory, agent_id, message)
+        except (OSError, TypeError, ValueError) as e:
+            st.warning(f"Could not save chat message: {e}")
+
+
 def show_chat_agent_interface(agent: Any) -> None:
     """Show the chat interface for chat and RAG agents."""
     agent_id = str(agent.id)
     st.subheader(f"Chat with {agent.name}")
 
     # Initialize or get chat history
-    if agent_id not in st.session_state.chat_history:
-        st.session_state.chat_history[agent_id] = []
-
-    chat_history = st.session_state.chat_history[agent_id]
+    chat_history = get_chat_history(agent_id)
 
     # Display chat history
-    display_chat_history(chat_history)
+    display_chat_history(chat_history, agent_id)
 
     # Chat input
     user_message = st.chat_input("Type a message...")
     if user_message:
-        # Add user message to chat history
-        chat_history.append({"role": "user", "content": user_message})
+        # Add user message to chat history and show it right away
+        add_chat_message(agent_id, {"role": "user", "content": user_message})
+        display_chat_message(chat_history[-1], len(chat_history) - 1)
 
-        # Show a placeholder message with thinking indicator
-        with st.chat_message("assistant"), st.spinner("🤔 Agent is thinking..."):
-            # Get response from agent
-            config = st.session_state.get("config", {})
-            data_provider = get_data_provider(config)
+        data_provider = _data_provider()
 
-            try:
+        try:
+            # Show a thinking indicator while waiting for the agent
+            with st.spinner("🤔 Agent is thinking..."):
                 agent_type_str = agent.type if agent.type else "chat"
                 response_data = data_provider.invoke_agent(
                     str(agent.id), user_message, agent_type=agent_type_str
                 )
 
-                # response_data is now an InvokeResponse Pydantic model
-                # Extract metadata - check both metadata and custom_outputs for sources
-                metadata_dict = {}
-                if response_data.metadata:
-                    metadata_dict.update(response_data.metadata)
-                if response_data.custom_outputs:
-                    metadata_dict.update(response_data.custom_outputs)
-
-                # Add other response fields to metadata
-                if response_data.model:
-                    metadata_dict["model"] = response_data.model
-                if response_data.rag_mode:
-                    metadata_dict["rag_mode"] = response_data.rag_mode
-                if response_data.created_at:
-                    metadata_dict["created_at"] = response_data.created_at
-
-                # Store full response structure
-                chat_history.append(
-                    {
-                        "role": "assistant",
-                        "content": response_data.response,
-                        "metadata": metadata_dict,
-                        "full_response": response_data.model_dump(),  # Convert to dict for storage
-                    }
-                )
+            # response_data is now an InvokeResponse Pydantic model
+            # Extract metadata - check both metadata and custom_outputs for sources
+            metadata_dict = {}
+            if response_data.metadata:
+                metadata_dict.update(response_data.metadata)
+            if response_data.custom_outputs:
+                metadata_dict.update(response_data.custom_outputs)
+
+            # Add other response fields to metadata
+            if response_data.model:
+                metadata_dict["model"] = response_data.model
+            if response_data.rag_mode:
+                metadata_dict["rag_mode"] = response_data.rag_mode
+            if response_data.created_at:
+                metadata_dict["created_at"] = response_data.created_at
+
+            # Store full response structure
+            add_chat_message(
+                agent_id,
+                {
+                    "role": "assistant",
+                    "content": response_data.response,
+                    "metadata": metadata_dict,
+                    "full_response": response_data.model_dump(),  # Convert to dict for storage
+                },
+            )
 
-                # Force UI refresh
-                st.rerun()
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
+            # Render the reply in place instead of rerunning the whole page
+            display_chat_message(chat_history[-1], len(chat_history) - 1)
+        except Exception as e:
+            st.error(f"Error: {str(e)}")
 
 
 def show_task_agent_interface(agent: Any) -> None:
@@ -162,8 +251,7 @@ def show_task_agent_interface(agent: Any) -> None:
     # Agent from list doesn't have config, need to call get_agent()
     agent_version = None
     try:
-        config = st.session_state.get("config", {})
-        data_provider = get_data_provider(config)
+        data_provider = _data_provider()
 
         with st.spinner("Loading agent configuration..."):
             agent_version = data_provider.get_agent(agent_id)
@@ -182,14 +270,27 @@ def show_task_agent_interface(agent: Any) -> None:
         st.warning("This task agent doesn't have an input schema defined.")
         return
 
-    # Initialize or get chat history
-    if agent_id not in st.session_state.chat_history:
-        st.session_state.chat_history[agent_id] = []
+    show_task_conversation(agent, input_schema)
+
 
-    chat_history = st.session_state.chat_history[agent_id]
+@st.fragment
+def show_task_conversation(agent: Any, input_schema: dict[str, Any]) -> None:
+    """Show the task history, input editor and submit button for a task agent.
+
+    Runs as a fragment so that editing the task input only reruns this part, not the
+    agent configuration lookup above it.
+
+    Args:
+        agent: The task agent
+        input_schema: JSON schema of the agent's task input
+    """
+    agent_id = str(agent.id)
+
+    # Initialize or get chat history
+    chat_history = get_chat_history(agent_id)
 
     # Display chat history
-    display_chat_history(chat_history)
+    display_chat_history(chat_history, agent_id)
 
     # Display task input editor
     st.markdown("### Task Input")
@@ -197,18 +298,14 @@ def show_task_agent_interface(agent: Any) -> None:
 
     # Disable button if there are validation errors
     if st.button("Submit Task", disabled=has_errors) and task_input:
-        # Add task to chat history
-        if agent_id not in st.session_state.chat_history:
-            st.session_state.chat_history[agent_id] = []
-
         # Add formatted input as user message
-        st.session_state.chat_history[agent_id].append(
-            {"role": "user", "content": json.dumps(task_input, indent=2)}
+        add_chat_message(
+            agent_id,
+            {"role": "user", "content": json.dumps(task_input, indent=2), "task_input": task_input},
         )
 
         # Execute task
-        config = st.session_state.get("config", {})
-        data_provider = get_data_provider(config)
+        data_provider = _data_provider()
 
         try:
             agent_type_str = agent.type if agent.type else "task"
@@ -219,72 +316,114 @@ def show_task_agent_interface(agent: Any) -> None:
                 )
 
             # Add response to chat history (response is InvokeResponse model)
-            st.session_state.chat_history[agent_id].append(
-                {"role": "assistant", "content": response.response}
-            )
+            add_chat_message(agent_id, {"role": "assistant", "content": response.response})
 
-            # Force UI refresh
-            st.rerun()
+            # Refresh the history above the editor without reloading the agent
+            st.rerun(scope="fragment")
         except Exception as e:
             st.error(f"Error: {str(e)}")
 
 
-def display_chat_history(chat_history: list[dict[str, Any]]) -> None:
+def _show_earlier_messages(state_key: str) -> None:
+    """Reveal the next window of earlier chat messages.
+
+    Args:
+        state_key: Session state key holding the number of visible messages
+    """
+    st.session_state[state_key] = (
+        st.session_state.get(state_key, CHAT_HISTORY_WINDOW) + CHAT_HISTORY_WINDOW
+    )
+
+
+def display_chat_history(chat_history: list[dict[str, Any]], agent_id: str = "") -> None:
     """Display chat history using st.chat_message components with Markdown and source citations.
 
+    Only the last CHAT_HISTORY_WINDOW messages are rendered; earlier ones are revealed
+    on request, so long conversations do not rebuild every message on each rerun.
+
     Args:
         chat_history: List of message dictionaries with role, content, and optional metadata.
+        agent_id: ID of the agent the conversation is with, so each conversation keeps
+            its own number of revealed messages.
     """
-    for idx, message in enumerate(chat_history):
-        role = message["role"]
-        content = message.get("content", "")
-        metadata = message.get("metadata", {})
-        full_response = message.get("full_response")
-
-        with st.chat_message(role):
-            if role == "user":
-                # User messages - check if JSON (for task agents)
-                try:
-                    if content.strip().startswith("{") and content.strip().endswith("}"):
-                        json_data = json.loads(content)
-                        st.json(json_data)
-                    else:
-                        st.markdown(content)
-                except (json.JSONDecodeError, AttributeError):
-                    st.markdown(content)
+    state_key = f"chat_history_visible_{agent_id}"
+    visible_count = st.session_state.get(state_key, CHAT_HISTORY_WINDOW)
+    start = max(len(chat_history) - visible_count, 0)
+
+    if start:
+        st.button(
+            f"Show {min(start, CHAT_HISTORY_WINDOW)} earlier messages",
+            key="chat_history_earlier",
+            on_click=_show_earlier_messages,
+            args=(state_key,),
+        )
+
+    for idx, message in enumerate(chat_history[start:], start):
+        display_chat_message(message, idx)
+
+
+def display_chat_message(message: dict[str, Any], idx: int) -> None:
+    """Display a single chat message with its citations, metadata and JSON toggle.
+
+    Args:
+        message: Message dictionary with role, content, and optional metadata.
+        idx: Position of the message in the chat history, used for widget keys.
+    """
+    role = message["role"]
+    content = message.get("content", "")
+    metadata = message.get("metadata", {})
+    full_response = message.get("full_response")
+
+    with st.chat_message(role):
+        if role == "user":
+            # Task agent inputs are stored parsed, so they are not re-parsed on every rerun
+            if "task_input" in message:
+                st.json(message["task_input"])
             else:
-                # Assistant messages - render with Markdown and show metadata
-                if content:
-                    st.markdown(content)
-
-                # Display source citations if available
-                # Check both camelCase and snake_case
-                source_nodes = (
-                    (metadata.get("sourceNodes") or metadata.get("source_nodes") or [])
-                    if isinstance(metadata, dict)
-                    else []
+                st.markdown(content)
+        else:
+            # Assistant messages - render with Markdown and show metadata
+            if content:
+                st.markdown(content)
+
+            # Display source citations if available
+            # Check both camelCase and snake_case
+            source_nodes = (
+                (metadata.get("sourceNodes") or metadata.get("source_nodes") or [])
+                if isinstance(metadata, dict)
+                else []
+            )
+            if source_nodes:
+                display_source_citations(source_nodes)
+
+            # Display metadata
+            if metadata:
+                display_message_metadata(metadata)
+
+            # Add JSON button if full response is available
+            if full_response:
+                # Create unique key for this message's JSON toggle
+                json_key = f"show_json_{idx}"
+                if json_key not in st.session_state:
+                    st.session_state[json_key] = False
+
+                # Toggle in a callback so the click is handled in the rerun it triggers
+                st.button(
+                    "📄 View Full JSON",
+                    key=f"json_btn_{idx}",
+                    type="secondary",
+                    on_click=_toggle_json,
+                    args=(json_key,),
                 )
-                if source_nodes:
-                    display_source_citations(source_nodes)
-
-                # Display metadata
-                if metadata:
-                    display_message_metadata(metadata)
 
-                # Add JSON button if full response is available
-                if full_response:
-                    # Create unique key for this message's JSON toggle
-                    json_key = f"show_json_{idx}"
-                    if json_key not in st.session_state:
-                        st.session_state[json_key] = False
+                # Show JSON if toggled
+                if st.session_state[json_key]:
+                    st.json(full_response)
 
-                    if st.button("📄 View Full JSON", key=f"json_btn_{idx}", type="secondary"):
-                        st.session_state[json_key] = not st.session_state[json_key]
-                        st.rerun()
 
-                    # Show JSON if toggled
-                    if st.session_state[json_key]:
-                        st.json(full_response)
+def _toggle_json(json_key: str) -> None:
+    """Toggle the full JSON view of a chat message."""
+    st.session_state[json_key] = not st.session_state.get(json_key, False)
 
 
 def display_source_citations(source_nodes: list[dict[str, Any]]) -> None:
@@ -369,6 +508,45 @@ def display_message_metadata(metadata: dict[str, Any]) -> None:
         st.caption(" | ".join(meta_parts))
 
 
+@st.cache_data(show_spinner=False)
+def _schema_default_json(input_schema: dict[str, Any]) -> str:
+    """Build the initial JSON text of the task editor, cached per input schema.
+
+    Args:
+        input_schema: JSON schema for task input validation.
+
+    Returns:
+        Indented JSON object with a sensible default for each typed property
+    """
+    # Create default JSON object based on schema, skipping properties of unknown type.
+    # Union types such as ["string", "null"] are lists (unhashable) and also skipped.
+    default_json = {
+        prop: SCHEMA_TYPE_DEFAULTS[prop_schema["type"]]()
+        for prop, prop_schema in input_schema.get("properties", {}).items()
+        if isinstance(prop_schema.get("type"), str) and prop_schema["type"] in SCHEMA_TYPE_DEFAULTS
+    }
+
+    return json.dumps(default_json, indent=2)
+
+
+@st.cache_resource(show_spinner=False)
+def _schema_validator(input_schema: dict[str, Any]) -> Validator | None:
+    """Build a validator for a task input schema, cached per schema.
+
+    Args:
+        input_schema: JSON schema for task input validation.
+
+    Returns:
+        Validator for the schema's draft, or None if the schema itself is invalid
+    """
+    validator_class = validator_for(input_schema)
+    try:
+        validator_class.check_schema(input_schema)
+    except SchemaError:
+        return None
+    return validator_class(input_schema)
+
+
 def json_task_editor(input_schema: dict[str, Any]) -> tuple[dict[str, Any] | None, bool]:
     """Create a JSON editor with schema validation.
 
@@ -378,44 +556,37 @@ def json_task_editor(input_schema: dict[str, Any]) -> tuple[dict[str, Any] | Non
     Returns:
         Tuple of (validated JSON object or None, has_errors boolean)
     """
-    # Create default JSON object based on schema
-    default_json: dict[str, Any] = {}
-    if "properties" in input_schema:
-        for prop, prop_schema in input_schema["properties"].items():
-            # Set sensible defaults based on type
-            prop_type = prop_schema.get("type")
-            if prop_type == "string":
-                default_json[prop] = ""
-            elif prop_type == "number" or prop_type == "integer":
-                default_json[prop] = 0
-            elif prop_type == "boolean":
-                default_json[prop] = False
-            elif prop_type == "array":
-                default_json[prop] = []
-            elif prop_type == "object":
-                default_json[prop] = {}
-
     # Add required field indicators
     required_fields = input_schema.get("required", [])
 
     if required_fields:
         st.caption("Fields marked with * are required")
 
-    json_str = st.text_area("JSON Input:", value=json.dumps(default_json, indent=2), height=200)
+    json_str = st.text_area("JSON Input:", value=_schema_default_json(input_schema), height=200)
 
     # Validate JSON format
     try:
-        task_input = json.loads(json_str)
+        task_input = loads(json_str)
     except json.JSONDecodeError as e:
         st.error(f"Invalid JSON format: {str(e)}")
         return None, True  # has errors
 
-    # Validate required fields
+    # Validate required fields, treating the empty strings the editor starts with as missing
     validation_errors = []
     for field in required_fields:
         if field not in task_input or task_input[field] == "":
             validation_errors.append(f"Field '{field}' is required.")
 
+    # Validate the rest of the schema (types, enums, patterns, nested required fields...)
+    validator = _schema_validator(input_schema)
+    if validator is not None:
+        for error in validator.iter_errors(task_input):
+            # Top-level required fields were already reported above
+            if error.validator == "required" and not error.absolute_path:
+                continue
+            location = "/".join(str(part) for part in error.absolute_path)
+            validation_errors.append(f"{location}: {error.message}" if location else error.message)
+
     # Show validation errors if any
     if validation_errors:
         for error in validation_errors:
@@ -441,12 +612,11 @@ def display_agent_tools(agent: Any) -> None:
         tools = agent.version.config.get("tools", [])
 
     if tools:
+        # Render all tools as one Markdown block rather than three elements per tool
+        tools_markdown = "\n\n---\n\n".join(
+            f"**{tool.get('name', 'Unnamed Tool')}** ({tool.get('type', 'unknown')})\n\n"
+            f"{tool.get('description', 'No description')}"
+            for tool in tools
+        )
         with st.expander("Agent Tools"):
-            for tool in tools:
-                tool_name = tool.get("name", "Unnamed Tool")
-                tool_type = tool.get("type", "unknown")
-                tool_desc = tool.get("description", "No description")
-
-                st.markdown(f"**{tool_name}** ({tool_type})")
-                st.markdown(f"{tool_desc}")
-                st.markdown("---")
+            st.markdown(tools_markdown)
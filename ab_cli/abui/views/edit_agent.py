@@ -5,8 +5,8 @@ from typing import Any
 
 import streamlit as st
 
-# Import functions from agents.py
-from ab_cli.abui.views.agents import clear_cache, get_agent_types, get_guardrails, get_models
+# Cached lookups shared with the other views
+from ab_cli.abui.utils.data_cache import clear_cache, get_agent_form_options
 
 # Import Pydantic models
 from ab_cli.models.agent import AgentCreate, AgentUpdate
@@ -96,9 +96,7 @@ def show_edit_agent_page() -> None:
 
     # Fetch models, guardrails, and agent types BEFORE creating the form
     # This prevents Streamlit from hanging inside the form
-    models = get_models()
-    guardrails = get_guardrails()
-    agent_types = get_agent_types()
+    models, guardrails, agent_types = get_agent_form_options()
 
     # Get default values from agent_to_edit if available
     default_name = agent_to_edit.agent.name if agent_to_edit else ""
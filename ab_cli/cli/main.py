@@ -368,6 +368,7 @@ from ab_cli.cli.auth import auth  # noqa: E402
 from ab_cli.cli.configure import configure  # noqa: E402
 from ab_cli.cli.invoke import invoke  # noqa: E402
 from ab_cli.cli.profiles import profiles  # noqa: E402
+from ab_cli.cli.repl import repl  # noqa: E402
 from ab_cli.cli.resources import resources  # noqa: E402
 from ab_cli.cli.ui import ui  # noqa: E402
 
@@ -380,6 +381,7 @@ main.add_command(invoke)
 main.add_command(profiles)
 main.add_command(resources)
 main.add_command(ui)
+main.add_command(repl)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,111 @@
+"""Hidden REPL command that serves CLI commands to a long-lived caller."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+from typing import Any
+
+import click
+
+
+def run_cli_command(command: click.Command, args: list[str]) -> dict[str, Any]:
+    """Run a CLI command in-process and capture its output.
+
+    The command sees an empty stdin, so confirmation prompts abort instead of
+    reading from the REPL's request stream.
+
+    Args:
+        command: Click command to run (normally the main CLI group)
+        args: Command-line arguments for the command
+
+    Returns:
+        Dictionary with returncode, stdout and stderr, mirroring subprocess.run
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    with (
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+        _empty_stdin(),
+    ):
+        try:
+            command.main(args, prog_name="ab", standalone_mode=False)
+            returncode = 0
+        except click.exceptions.Exit as e:
+            returncode = e.exit_code
+        except click.ClickException as e:
+            e.show(file=stderr)
+            returncode = e.exit_code
+        except click.Abort:
+            stderr.write("Aborted!\n")
+            returncode = 1
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                stderr.write(f"{e.code}\n")
+                returncode = 1
+        except Exception as e:
+            stderr.write(f"Error: {e}\n")
+            returncode = 1
+
+    return {"returncode": returncode, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+@contextlib.contextmanager
+def _empty_stdin() -> Any:
+    """Temporarily replace stdin with an empty stream."""
+    original = sys.stdin
+    sys.stdin = io.StringIO("")
+    try:
+        yield
+    finally:
+        sys.stdin = original
+
+
+@click.command("repl", hidden=True)
+@click.pass_context
+def repl(ctx: click.Context) -> None:
+    """Serve CLI commands read from stdin, one request per line.
+
+    Each request is a JSON array of arguments (e.g. ["agents", "list", "--format",
+    "json"]). Each reply is written as a single JSON line with returncode, stdout and
+    stderr. The global --verbose, --config and --profile options given to `ab repl`
+    apply to every request. The command exits when stdin is closed.
+
+    Used by the UI's CLI data provider to avoid starting a new process per command.
+    """
+    from ab_cli.cli.main import main
+
+    base_args: list[str] = []
+    if ctx.obj.get("verbose"):
+        base_args.append("--verbose")
+    if ctx.obj.get("config_path"):
+        base_args.extend(["--config", ctx.obj["config_path"]])
+    if ctx.obj.get("profile"):
+        base_args.extend(["--profile", ctx.obj["profile"]])
+
+    requests = sys.stdin
+    replies = sys.stdout
+
+    for line in requests:
+        if not line.strip():
+            continue
+
+        try:
+            args = json.loads(line)
+            if not isinstance(args, list):
+                raise ValueError("request must be a JSON array of arguments")
+        except ValueError as e:
+            reply = {"returncode": 2, "stdout": "", "stderr": f"Invalid request: {e}\n"}
+        else:
+            reply = run_cli_command(main, base_args + [str(arg) for arg in args])
+
+        replies.write(json.dumps(reply) + "\n")
+        replies.flush()
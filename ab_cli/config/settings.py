@@ -172,6 +172,14 @@ class ABSettings(BaseSettings):
             ),
         ]
 
+        chat_history_dir: Annotated[
+            str | None,
+            Field(
+                default=None,
+                description="Directory where chat histories are saved (not saved when unset)",
+            ),
+        ]
+
         @field_validator("data_provider")
         @classmethod
         def validate_data_provider(cls, v: str) -> str:
@@ -5,6 +5,7 @@ import uuid
 from typing import Any, Dict, List, Optional
 
 import pytest
+import streamlit as st
 from streamlit.testing.v1 import AppTest
 
 from ab_cli.models.agent import Agent, AgentVersion, VersionConfig
@@ -81,6 +82,13 @@ def navigate_to_page(app_test: AppTest, page_name: str) -> None:
     app_test.run()
 
 
+@pytest.fixture(autouse=True)
+def clear_streamlit_caches() -> None:
+    """Clear Streamlit caches so cached provider results don't leak between tests."""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
 @pytest.fixture
 def test_data_provider() -> TestDataProvider:
     """Create a TestDataProvider instance with test data.
@@ -6,7 +6,8 @@ import uuid
 import pytest
 from streamlit.testing.v1 import AppTest
 
-from ab_cli.models.agent import Agent, AgentVersion, VersionConfig
+from ab_cli.abui.views.agent_details import _format_version_row
+from ab_cli.models.agent import Agent, AgentVersion, Version, VersionConfig
 from tests.test_abui.streamlit_test_wrapper import (
     display_agent_config_test,
     show_agent_details_page_test,
@@ -141,6 +142,36 @@ def test_display_agent_config_inference_config():
     assert hasattr(app_test, "json"), "Expected JSON element for inference config not found"
 
 
+def test_display_agent_config_empty():
+    """Test that display_agent_config renders nothing for an empty configuration."""
+    app_test = AppTest.from_function(display_agent_config_test)
+    app_test.session_state["test_config"] = {}
+
+    app_test.run()
+
+    assert len(app_test.markdown) == 0
+    assert len(app_test.json) == 0
+
+
+def test_display_agent_config_rag_and_additional():
+    """Test that RAG parameters and leftover fields get their own sections."""
+    app_test = AppTest.from_function(display_agent_config_test)
+    app_test.session_state["test_config"] = {
+        "llmModelId": "test-model-1",
+        "limit": 5,
+        "rerankerEnabled": True,
+        "customField": "custom-value",
+    }
+
+    app_test.run()
+
+    markdown_values = [md.value for md in app_test.markdown]
+    assert "#### RAG Configuration" in markdown_values
+    assert "**Chunk Limit:** 5  \n**Reranker Enabled:** True" in markdown_values
+    assert "#### Additional Configuration" in markdown_values
+    assert app_test.json[-1].value == '{"customField": "custom-value"}'
+
+
 def test_display_agent_config_verbose():
     """Test the display_agent_config function with verbose mode enabled."""
     # Create a test AppTest instance
@@ -171,6 +202,29 @@ def test_display_agent_config_verbose():
     assert model_id_displayed, "Model ID not displayed in UI when verbose mode enabled"
 
 
+def test_format_version_row():
+    """Test formatting of a version as a versions table row."""
+    version = Version(
+        id=uuid.UUID("12345678-1234-1234-1234-123456789abc"),
+        number=3,
+        version_label=None,
+        notes="n" * 60,
+        created_at="2026-01-01T00:00:00Z",
+        created_by="test-user",
+    )
+
+    row = _format_version_row(version)
+
+    assert row == {
+        "Number": 3,
+        "Label": "-",
+        "Notes": "n" * 47 + "...",
+        "Created": "2026-01-01",
+        "Created By": "test-user",
+        "Version ID": "12345678-1234-1234-1234-123456789abc",
+    }
+
+
 def test_show_agent_details_page_basic(test_agent, test_data_provider):
     """Test the basic display of the agent details page."""
     # Create a test AppTest instance
@@ -219,6 +273,29 @@ def test_show_agent_details_page_basic(test_agent, test_data_provider):
     assert chat_button_found, "Chat with Agent button not found"
 
 
+def test_show_agent_details_page_general_info_single_markdown(test_agent, test_data_provider):
+    """Test that the General Info fields are rendered in one markdown element."""
+    app_test = AppTest.from_function(show_agent_details_page_test)
+
+    agent_version = convert_test_agent_to_pydantic(test_agent.copy())
+
+    app_test.session_state["agent_to_view"] = agent_version
+    app_test.session_state["current_page"] = "AgentDetails"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["verbose"] = False
+
+    app_test.run()
+
+    info_blocks = [md.value for md in app_test.markdown if "**ID:**" in md.value]
+    assert len(info_blocks) == 1, "General Info should be rendered as a single markdown element"
+
+    info_block = info_blocks[0]
+    assert str(agent_version.agent.id) in info_block
+    assert f"**Name:** {agent_version.agent.name}" in info_block
+    assert f"**Status:** {agent_version.agent.status}" in info_block
+
+
 def test_show_agent_details_page_missing_agent():
     """Test the agent details page when no agent is provided."""
     # Create a test AppTest instance
@@ -296,6 +373,57 @@ def test_show_agent_details_page_error_fetching_config(test_data_provider):
     assert error_found, "Expected error message not displayed when fetching configuration fails"
 
 
+def test_show_agent_details_page_fetches_config_once(test_data_provider):
+    """Test that the configuration of a summary Agent is fetched once and reused."""
+    app_test = AppTest.from_function(show_agent_details_page_test)
+
+    summary_agent = test_data_provider.add_test_agent(
+        {
+            "id": "12345678-1234-1234-1234-123456789997",
+            "type": "chat",
+            "name": "Test Summary Agent",
+            "description": "Agent without configuration",
+            "status": "CREATED",
+            "created_at": "2026-01-01T00:00:00Z",
+            "created_by": "test-user",
+            "modified_at": "2026-01-01T00:00:00Z",
+        }
+    )
+    test_data_provider.reset_call_tracking()
+
+    app_test.session_state["agent_to_view"] = summary_agent
+    app_test.session_state["current_page"] = "AgentDetails"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["verbose"] = False
+
+    app_test.run()
+    assert test_data_provider.get_call_count("get_agent") == 1
+
+    # The fetched AgentVersion replaces the summary so later reruns reuse it
+    assert hasattr(app_test.session_state["agent_to_view"], "version")
+
+
+def test_show_agent_details_page_reuses_last_fetched_agent(test_agent, test_data_provider):
+    """Test that a previously fetched configuration is reused for a summary Agent."""
+    app_test = AppTest.from_function(show_agent_details_page_test)
+
+    agent_version = convert_test_agent_to_pydantic(test_agent.copy())
+    test_data_provider.reset_call_tracking()
+
+    app_test.session_state["agent_to_view"] = agent_version.agent
+    app_test.session_state["_last_fetched_agent"] = agent_version
+    app_test.session_state["current_page"] = "AgentDetails"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["verbose"] = False
+
+    app_test.run()
+
+    assert test_data_provider.get_call_count("get_agent") == 0
+    assert app_test.session_state["agent_to_view"] == agent_version
+
+
 def test_show_agent_details_page_edit_navigation(test_agent, test_data_provider):
     """Test navigation to edit from agent details page."""
     # Create a test AppTest instance
@@ -1,8 +1,15 @@
 """Tests for the agent list view functions."""
 
+from unittest.mock import patch
+
 import pytest
+import streamlit as st
 from streamlit.testing.v1 import AppTest
 
+from ab_cli.abui.utils.lazy_imports import get_pandas
+from ab_cli.abui.utils.data_cache import get_agent_form_options, get_models
+from ab_cli.abui.views.agents import _agents_table
+from ab_cli.api.pagination import PaginatedResult
 from tests.test_abui.streamlit_test_wrapper import show_agents_page_test
 from tests.test_abui.test_data_provider import TestDataProvider
 
@@ -164,4 +171,264 @@ def test_agents_page_navigation_buttons(test_data_provider: TestDataProvider) ->
     app_test.run(timeout=10)
     
     # Just verify we have buttons rendered
-    assert hasattr(app_test, "button") and len(app_test.button) > 0, "Navigation buttons should be present"
\ No newline at end of file
+    assert hasattr(app_test, "button") and len(app_test.button) > 0, "Navigation buttons should be present"
+
+
+def test_agents_page_reuses_cached_page(test_data_provider: TestDataProvider) -> None:
+    """Test that reruns showing the same page don't call the provider again."""
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+
+    app_test.run(timeout=10)
+    calls_after_first_run = test_data_provider.get_call_count("get_agents")
+    assert calls_after_first_run >= 1
+
+    app_test.run(timeout=10)
+    assert test_data_provider.get_call_count("get_agents") == calls_after_first_run
+
+
+def test_agents_page_table_columns(test_data_provider: TestDataProvider) -> None:
+    """Test that the table view shows one row per agent with the expected columns."""
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+
+    app_test.run(timeout=10)
+
+    df = app_test.dataframe[0].value
+    assert list(df.columns) == ["ID", "Name", "Type", "Status", "Owner", "Created", "Updated"]
+
+    agents = test_data_provider.get_agents()
+    assert len(df) == len(agents)
+    assert df["ID"].tolist() == [str(agent.id) for agent in agents]
+
+
+def test_agents_page_number_input_changes_page(test_data_provider: TestDataProvider) -> None:
+    """Test that the page number input moves to the requested page."""
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["agents_page_size"] = 1
+
+    app_test.run(timeout=10)
+    assert app_test.session_state["agents_page"] == 1
+
+    app_test.number_input(key="page_input").set_value(2).run(timeout=10)
+
+    assert app_test.session_state["agents_page"] == 2
+    second_agent = test_data_provider.get_agents()[1]
+    assert app_test.dataframe[0].value["ID"].tolist() == [str(second_agent.id)]
+
+
+def test_agents_page_table_actions_single_widget(test_data_provider: TestDataProvider) -> None:
+    """Test that the table actions are offered by one widget, disabled without a selection."""
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+
+    app_test.run(timeout=10)
+
+    actions = app_test.button_group(key="agent_action")
+    # Streamlit renders the leading emoji of each option as its icon
+    assert list(actions.options) == ["Copy Full ID", "View Details", "Edit Agent", "Chat"]
+    assert actions.disabled
+    assert not [b for b in app_test.button if "View Details" in b.label]
+
+
+def test_get_models_cached_per_provider(test_data_provider: TestDataProvider) -> None:
+    """Test that model IDs are fetched from the provider once and then reused."""
+    st.session_state["data_provider"] = test_data_provider
+    try:
+        with patch.object(
+            test_data_provider, "get_models", wraps=test_data_provider.get_models
+        ) as spy:
+            first = get_models()
+            second = get_models()
+    finally:
+        del st.session_state["data_provider"]
+
+    assert first == second
+    assert first
+    assert spy.call_count == 1
+
+
+def test_agents_page_cards_rendered_in_batches(test_data_provider: TestDataProvider) -> None:
+    """Test that the card view renders a first batch and reveals the rest on request."""
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["agent_view_mode"] = "🗂️ Cards"
+
+    agent_count = len(test_data_provider.get_agents())
+    with patch("ab_cli.abui.views.agents.CARDS_BATCH_SIZE", 2):
+        app_test.run(timeout=10)
+        assert len(app_test.expander) == 2
+
+        app_test.button(key="agent_cards_more").click().run(timeout=10)
+
+    assert len(app_test.expander) == min(agent_count, 4)
+
+
+def test_agents_page_without_total_count(test_data_provider: TestDataProvider) -> None:
+    """Test pagination when the provider cannot report the total number of agents."""
+    agents = test_data_provider.get_agents()
+    result = PaginatedResult(
+        agents=agents[:1],
+        offset=0,
+        limit=1,
+        total_count=None,
+        has_filters=True,
+        agent_type=None,
+        name_pattern=None,
+    )
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+
+    with patch.object(test_data_provider, "get_agents_paginated", return_value=result):
+        app_test.run(timeout=10)
+
+    assert any("Showing 1-1 of many agents" in c.value for c in app_test.caption)
+    assert app_test.number_input(key="page_input").max == 2
+
+
+def test_get_agent_form_options(test_data_provider: TestDataProvider) -> None:
+    """Test that the form options match the individual lookups."""
+    st.session_state["data_provider"] = test_data_provider
+    try:
+        models, guardrails, agent_types = get_agent_form_options()
+        assert models == get_models()
+    finally:
+        del st.session_state["data_provider"]
+
+    assert models
+    assert guardrails == [g.name for g in test_data_provider.get_guardrails().guardrails]
+    assert agent_types == [t.type for t in test_data_provider.get_agent_types().agent_types]
+
+
+def test_agents_table_cached_on_rows() -> None:
+    """Test that the table DataFrame is built once per distinct set of rows."""
+    rows = (("id-1", "Agent 1", "tool", "CREATED", None, "2024-01-01", "2024-01-02"),)
+
+    with patch("ab_cli.abui.views.agents.get_pandas", wraps=get_pandas) as spy:
+        first = _agents_table(rows)
+        second = _agents_table(rows)
+        assert spy.call_count == 1
+
+        _agents_table((("id-2", *rows[0][1:]),))
+        assert spy.call_count == 2
+
+    assert first.equals(second)
+    assert first.at[0, "Name"] == "Agent 1"
+    assert str(first["ID"].dtype) == "string"
+    assert str(first["Status"].dtype) == "category"
+
+
+def test_agents_page_cards_fill_columns_in_order(test_data_provider: TestDataProvider) -> None:
+    """Test that cards alternate between the grid columns in list order."""
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["agent_view_mode"] = "🗂️ Cards"
+
+    app_test.run(timeout=10)
+
+    names = [agent.name for agent in test_data_provider.get_agents()]
+    # The card grid columns are the ones holding the card expanders
+    grid = [column for column in app_test.columns if len(column.expander) > 0]
+    assert [e.label for e in grid[0].expander] == names[0::2]
+    assert [e.label for e in grid[1].expander] == names[1::2]
+
+
+def _agents_page(agents: list) -> PaginatedResult:
+    """Build a single page holding the given agents."""
+    return PaginatedResult(
+        agents=agents,
+        offset=0,
+        limit=50,
+        total_count=len(agents),
+        has_filters=False,
+        agent_type=None,
+        name_pattern=None,
+    )
+
+
+def test_agents_page_refresh_shows_new_page(test_data_provider: TestDataProvider) -> None:
+    """Test that the refresh button shows the refetched page in the run it triggers."""
+    agents = test_data_provider.get_agents()
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+
+    with patch.object(test_data_provider, "get_agents_paginated", return_value=_agents_page(agents[:2])):
+        app_test.run(timeout=10)
+    assert len(app_test.dataframe[0].value) == 2
+
+    with patch.object(test_data_provider, "get_agents_paginated", return_value=_agents_page(agents)):
+        next(b for b in app_test.button if b.label == "Refresh Agent List").click().run(timeout=10)
+
+    assert len(app_test.dataframe[0].value) == len(agents)
+    assert any("Cache cleared" in s.value for s in app_test.success)
+
+
+def test_agents_page_ignores_stale_row_selection(test_data_provider: TestDataProvider) -> None:
+    """Test that a selected row missing from the refreshed page is dropped."""
+    agents = test_data_provider.get_agents()
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+
+    with patch.object(test_data_provider, "get_agents_paginated", return_value=_agents_page(agents)):
+        app_test.run(timeout=10)
+        app_test.session_state["agents_df_p1"] = {"selection": {"rows": [2], "columns": []}}
+        app_test.run(timeout=10)
+    assert any(m.value.startswith(f"**Selected:** {agents[2].name}") for m in app_test.markdown)
+
+    with patch.object(test_data_provider, "get_agents_paginated", return_value=_agents_page(agents[:2])):
+        next(b for b in app_test.button if b.label == "Refresh Agent List").click().run(timeout=10)
+
+    assert not app_test.error
+    assert len(app_test.dataframe[0].value) == 2
+    assert any(m.value == "**Selected:** None" for m in app_test.markdown)
+    assert app_test.button_group(key="agent_action").disabled
+
+
+def test_agents_page_card_batches_reset(test_data_provider: TestDataProvider) -> None:
+    """Test that revealed card batches are forgotten on refresh and view-mode changes."""
+    app_test = AppTest.from_function(show_agents_page_test)
+
+    app_test.session_state["current_page"] = "Agents"
+    app_test.session_state["config"] = {"ui": {"mock": True}}
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["agent_view_mode"] = "🗂️ Cards"
+
+    with patch("ab_cli.abui.views.agents.CARDS_BATCH_SIZE", 1):
+        app_test.run(timeout=10)
+        app_test.button(key="agent_cards_more").click().run(timeout=10)
+        assert len(app_test.expander) == 2
+
+        next(b for b in app_test.button if b.label == "Refresh Agent List").click().run(timeout=10)
+        assert len(app_test.expander) == 1
+
+        app_test.button(key="agent_cards_more").click().run(timeout=10)
+        app_test.button_group(key="agent_view_mode").set_value("📋 Table").run(timeout=10)
+        assert "agent_cards_visible" not in app_test.session_state
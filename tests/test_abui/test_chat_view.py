@@ -3,6 +3,8 @@
 import copy
 import json
 import os
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
@@ -70,6 +72,94 @@ def test_chat_agent_selection(test_data_provider: TestDataProvider) -> None:
         assert hasattr(app_test, "markdown") or hasattr(app_test, "text"), "App should display some content"
 
 
+def test_chat_agent_selection_selects_chosen_agent(test_data_provider: TestDataProvider) -> None:
+    """Test that the agent picked in the selectbox is the one opened for chat."""
+    app_test = AppTest.from_function(show_chat_page_test)
+    app_test.session_state["data_provider"] = test_data_provider
+
+    app_test.run()
+    agents = test_data_provider.get_agents()
+    app_test.selectbox[0].set_value(1)
+    app_test.button[0].click().run()
+
+    selected = app_test.session_state["selected_agent"]
+    assert selected is not None
+    assert selected.id == agents[1].id
+
+
+def test_chat_header_buttons_act_in_one_run(test_data_provider: TestDataProvider) -> None:
+    """Test that the chat header buttons take effect in the run their click triggers."""
+    agent = test_data_provider.get_agents()[0]
+
+    app_test = AppTest.from_function(show_chat_page_test)
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["selected_agent"] = agent
+    app_test.run()
+
+    next(b for b in app_test.button if b.label == "👁️ View Agent").click().run()
+    assert app_test.session_state["current_page"] == "AgentDetails"
+    assert app_test.session_state["agent_to_view"] is agent
+
+    next(b for b in app_test.button if b.label == "← Back to Agent Selection").click().run()
+    assert app_test.session_state["selected_agent"] is None
+    assert app_test.subheader[0].value == "Select an Agent to Chat With"
+
+
+def test_chat_agent_list_cached(test_data_provider: TestDataProvider) -> None:
+    """Test that the agent list is fetched once across reruns until refreshed."""
+    app_test = AppTest.from_function(show_chat_page_test)
+    app_test.session_state["data_provider"] = test_data_provider
+
+    app_test.run()
+    app_test.selectbox[0].set_value(1).run()
+    assert test_data_provider.get_call_count("get_agents") == 1
+
+    app_test.button[1].click().run()
+    assert test_data_provider.get_call_count("get_agents") == 2
+
+
+def test_chat_reply_rendered_in_place(test_data_provider: TestDataProvider) -> None:
+    """Test that sending a message shows it and the agent's reply in the same run."""
+    agent = next(a for a in test_data_provider.get_agents() if a.type != "task")
+
+    app_test = AppTest.from_function(show_chat_page_test)
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["selected_agent"] = agent
+    app_test.run()
+
+    app_test.chat_input[0].set_value("Hello there").run()
+
+    history = app_test.session_state["chat_history"][str(agent.id)]
+    assert [message["role"] for message in history] == ["user", "assistant"]
+    assert [message.name for message in app_test.chat_message] == ["user", "assistant"]
+    assert app_test.chat_message[0].markdown[0].value == "Hello there"
+
+
+def test_chat_history_saved_and_restored(
+    test_data_provider: TestDataProvider, tmp_path: Path
+) -> None:
+    """Test that chat messages are saved and restored in a new session when configured."""
+    agent = next(a for a in test_data_provider.get_agents() if a.type != "task")
+    config = SimpleNamespace(ui=SimpleNamespace(chat_history_dir=str(tmp_path)))
+
+    app_test = AppTest.from_function(show_chat_page_test)
+    app_test.session_state["config"] = config
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["selected_agent"] = agent
+    app_test.run()
+    app_test.chat_input[0].set_value("Remember me").run()
+
+    new_session = AppTest.from_function(show_chat_page_test)
+    new_session.session_state["config"] = config
+    new_session.session_state["data_provider"] = test_data_provider
+    new_session.session_state["selected_agent"] = agent
+    new_session.run()
+
+    history = new_session.session_state["chat_history"][str(agent.id)]
+    assert [message["role"] for message in history] == ["user", "assistant"]
+    assert new_session.chat_message[0].markdown[0].value == "Remember me"
+
+
 def test_chat_interface_display(test_data_provider: TestDataProvider) -> None:
     """Test the chat interface display for a chat agent."""
     # Force mock provider mode for CI compatibility
@@ -193,6 +283,45 @@ def test_task_interface_display(test_data_provider: TestDataProvider) -> None:
                 hasattr(app_test, "subheader")), "App should display some content"
 
 
+def test_task_submission_updates_history(test_data_provider: TestDataProvider) -> None:
+    """Test that submitting a task records the input and the agent's response."""
+    task_agent = {
+        "id": "bbbbbbbb-cccc-dddd-eeee-444444444444",
+        "name": "Submit Task Agent",
+        "description": "A task agent for submission testing",
+        "type": "task",
+        "status": "CREATED",
+        "currentVersionId": "bbbbbbbb-cccc-dddd-eeee-444444444445",
+        "created_at": "2026-01-01T00:00:00Z",
+        "created_by": "test",
+        "modified_at": "2026-01-01T00:00:00Z",
+        "agent_config": {
+            "llmModelId": "test-model",
+            "inputSchema": {
+                "type": "object",
+                "properties": {"taskDescription": {"type": "string"}},
+                "required": ["taskDescription"],
+            },
+        },
+    }
+    agent_version = test_data_provider.add_test_agent_version(
+        convert_test_agent_to_pydantic(task_agent)
+    )
+
+    app_test = AppTest.from_function(show_chat_page_test)
+    app_test.session_state["data_provider"] = test_data_provider
+    app_test.session_state["selected_agent"] = agent_version.agent
+    app_test.run()
+
+    app_test.text_area[0].set_value('{"taskDescription": "Plan the launch"}').run()
+    next(b for b in app_test.button if b.label == "Submit Task").click().run()
+
+    history = app_test.session_state["chat_history"][task_agent["id"]]
+    assert [message["role"] for message in history] == ["user", "assistant"]
+    assert history[0]["task_input"] == {"taskDescription": "Plan the launch"}
+    assert not app_test.exception
+
+
 def test_agent_tools_display() -> None:
     """Test the display of agent tools in the chat interface."""
     # Import required models
@@ -267,6 +396,30 @@ def test_agent_tools_display() -> None:
                "Should display at least one tool"
 
 
+def test_agent_tools_rendered_as_one_block() -> None:
+    """Test that all agent tools are rendered in a single Markdown element."""
+    def tools_display():
+        from types import SimpleNamespace
+
+        from ab_cli.abui.views.chat import display_agent_tools
+
+        tools = [
+            {"type": "retrieval", "name": "document_search", "description": "Search documents"},
+            {"type": "function", "name": "calculator"},
+        ]
+        display_agent_tools(SimpleNamespace(version=SimpleNamespace(config={"tools": tools})))
+
+    app_test = AppTest.from_function(tools_display)
+    app_test.run()
+
+    markdown = app_test.expander[0].markdown
+    assert len(markdown) == 1
+    assert markdown[0].value == (
+        "**document_search** (retrieval)\n\nSearch documents"
+        "\n\n---\n\n**calculator** (function)\n\nNo description"
+    )
+
+
 def test_chat_message_display() -> None:
     """Test the display of chat messages using st.chat_message component."""
     # Create a test AppTest instance with a mocked chat_message function
@@ -304,6 +457,96 @@ def test_chat_message_display() -> None:
         assert hasattr(app_test, "text") or hasattr(app_test, "markdown"), "Should display message content"
 
 
+def test_chat_history_rendered_in_window() -> None:
+    """Test that only the latest messages are rendered until earlier ones are requested."""
+    def long_chat_display():
+        from ab_cli.abui.views.chat import display_chat_history
+
+        display_chat_history(
+            [{"role": "user", "content": f"Message {i}"} for i in range(60)]
+        )
+
+    app_test = AppTest.from_function(long_chat_display)
+    app_test.run()
+
+    assert len(app_test.chat_message) == 50
+    assert app_test.chat_message[0].markdown[0].value == "Message 10"
+    assert app_test.button(key="chat_history_earlier").label == "Show 10 earlier messages"
+
+    app_test.button(key="chat_history_earlier").click().run()
+
+    assert len(app_test.chat_message) == 60
+    assert app_test.chat_message[0].markdown[0].value == "Message 0"
+    assert not any(button.key == "chat_history_earlier" for button in app_test.button)
+
+
+def test_chat_history_window_kept_per_agent() -> None:
+    """Test that revealing earlier messages of one conversation leaves the others windowed."""
+    def agent_chat_display():
+        import streamlit as st
+
+        from ab_cli.abui.views.chat import display_chat_history
+
+        display_chat_history(
+            [{"role": "user", "content": f"Message {i}"} for i in range(60)],
+            st.session_state["test_agent_id"],
+        )
+
+    app_test = AppTest.from_function(agent_chat_display)
+    app_test.session_state["test_agent_id"] = "agent-1"
+    app_test.run()
+    app_test.button(key="chat_history_earlier").click().run()
+    assert len(app_test.chat_message) == 60
+
+    app_test.session_state["test_agent_id"] = "agent-2"
+    app_test.run()
+    assert len(app_test.chat_message) == 50
+
+    app_test.session_state["test_agent_id"] = "agent-1"
+    app_test.run()
+    assert len(app_test.chat_message) == 60
+
+
+def test_task_input_rendered_as_json() -> None:
+    """Test that task inputs are shown as JSON from their stored parsed value."""
+    def task_history_display():
+        from ab_cli.abui.views.chat import display_chat_history
+
+        display_chat_history(
+            [
+                {"role": "user", "content": '{"query": "x"}', "task_input": {"query": "x"}},
+                {"role": "user", "content": '{"typed": "by hand"}'},
+            ]
+        )
+
+    app_test = AppTest.from_function(task_history_display)
+    app_test.run()
+
+    assert len(app_test.json) == 1
+    assert app_test.json[0].value == json.dumps({"query": "x"})
+    assert app_test.chat_message[1].markdown[0].value == '{"typed": "by hand"}'
+
+
+def test_chat_full_json_toggle() -> None:
+    """Test that the full JSON view toggles on a single click."""
+    def chat_with_full_response():
+        from ab_cli.abui.views.chat import display_chat_history
+
+        display_chat_history(
+            [{"role": "assistant", "content": "Hi", "full_response": {"response": "Hi"}}]
+        )
+
+    app_test = AppTest.from_function(chat_with_full_response)
+    app_test.run()
+    assert len(app_test.json) == 0
+
+    app_test.button(key="json_btn_0").click().run()
+    assert app_test.json[0].value == json.dumps({"response": "Hi"})
+
+    app_test.button(key="json_btn_0").click().run()
+    assert len(app_test.json) == 0
+
+
 def test_json_response_handling() -> None:
     """Test handling of JSON responses in the chat interface."""
     # Define the json message display function
@@ -365,4 +608,112 @@ def test_json_editor_validation() -> None:
     app_test.run()
     
     # For now, we'll just check that the function runs without errors
-    assert True, "JSON task editor test"
\ No newline at end of file
+    assert True, "JSON task editor test"
+
+
+def test_json_editor_schema_defaults() -> None:
+    """Test that the JSON editor starts from a default value for each typed property."""
+    app_test = AppTest.from_function(json_task_editor_test)
+    app_test.session_state["test_input_schema"] = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "count": {"type": "integer"},
+            "ratio": {"type": "number"},
+            "enabled": {"type": "boolean"},
+            "tags": {"type": "array"},
+            "options": {"type": "object"},
+            "untyped": {},
+        },
+    }
+
+    app_test.run()
+
+    assert json.loads(app_test.text_area[0].value) == {
+        "name": "",
+        "count": 0,
+        "ratio": 0,
+        "enabled": False,
+        "tags": [],
+        "options": {},
+    }
+
+
+def test_json_editor_skips_union_typed_properties() -> None:
+    """Test that properties with a list of types get no default instead of failing."""
+    app_test = AppTest.from_function(json_task_editor_test)
+    app_test.session_state["test_input_schema"] = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "note": {"type": ["string", "null"]},
+        },
+    }
+
+    app_test.run()
+
+    assert not app_test.exception
+    assert json.loads(app_test.text_area[0].value) == {"name": ""}
+    assert not app_test.error
+
+
+def test_json_editor_validates_schema() -> None:
+    """Test that the JSON editor reports schema violations besides missing fields."""
+    app_test = AppTest.from_function(json_task_editor_test)
+    app_test.session_state["test_input_schema"] = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "priority": {"type": "integer", "enum": [1, 2, 3]},
+        },
+        "required": ["name"],
+    }
+    app_test.run()
+
+    app_test.text_area[0].set_value('{"name": "", "priority": 7}').run()
+    errors = [error.value for error in app_test.error]
+    assert "Field 'name' is required." in errors
+    assert any(error.startswith("priority: 7 is not one of") for error in errors)
+
+    app_test.text_area[0].set_value('{"name": "Report", "priority": 2}').run()
+    assert not app_test.error
+
+
+def test_json_editor_validates_nested_required_fields() -> None:
+    """Test that required fields of nested objects are enforced once each."""
+    app_test = AppTest.from_function(json_task_editor_test)
+    app_test.session_state["test_input_schema"] = {
+        "type": "object",
+        "properties": {
+            "addr": {
+                "type": "object",
+                "properties": {"city": {"type": "string"}},
+                "required": ["city"],
+            },
+        },
+        "required": ["addr"],
+    }
+    app_test.run()
+
+    app_test.text_area[0].set_value("{}").run()
+    assert [error.value for error in app_test.error] == ["Field 'addr' is required."]
+
+    app_test.text_area[0].set_value('{"addr": {}}').run()
+    assert [error.value for error in app_test.error] == ["addr: 'city' is a required property"]
+
+    app_test.text_area[0].set_value('{"addr": {"city": "Paris"}}').run()
+    assert not app_test.error
+
+
+def test_json_editor_rejects_invalid_json() -> None:
+    """Test that the JSON editor reports input that is not valid JSON."""
+    app_test = AppTest.from_function(json_task_editor_test)
+    app_test.session_state["test_input_schema"] = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+    }
+    app_test.run()
+
+    app_test.text_area[0].set_value('{"name": }').run()
+
+    assert app_test.error[0].value.startswith("Invalid JSON format:")
@@ -0,0 +1,202 @@
+"""Tests for the CLI data provider's long-lived worker process."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from ab_cli.abui.providers import cli_data_provider
+from ab_cli.abui.providers.cli_data_provider import (
+    CLIDataProvider,
+    _CLIWorker,
+    _WorkerStoppedError,
+)
+
+
+def test_worker_runs_commands() -> None:
+    """Test that the worker runs several commands in the same process."""
+    worker = _CLIWorker([sys.executable, "-m", "ab_cli.cli.main"])
+    try:
+        first = worker.run(["--version"], timeout=30)
+        second = worker.run(["no-such-command"], timeout=30)
+        assert worker.process.poll() is None
+    finally:
+        worker.close()
+
+    assert first.returncode == 0
+    assert "version" in first.stdout
+    assert second.returncode == 2
+    assert "No such command" in second.stderr
+
+
+def test_provider_falls_back_without_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the provider stops using the worker when it cannot be started."""
+    provider = CLIDataProvider()
+    monkeypatch.setattr(provider, "_base_command", lambda: ["ab-cli-does-not-exist"])
+
+    assert provider._run_in_worker(["--version"]) is None
+    assert provider.use_worker is False
+    assert provider._worker is None
+
+
+def test_worker_restarted_after_it_stops(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a stopped worker is replaced on the next request, not turned off."""
+    provider = CLIDataProvider()
+    monkeypatch.setattr(
+        provider, "_base_command", lambda: [sys.executable, "-m", "ab_cli.cli.main"]
+    )
+    try:
+        first = provider._run_in_worker(["--version"])
+        worker = provider._worker
+        assert first is not None and worker is not None
+        worker.close()
+
+        second = provider._run_in_worker(["--version"])
+        assert second is not None and second.returncode == 0
+        assert provider.use_worker is True
+        assert provider._worker is not None and provider._worker is not worker
+    finally:
+        if provider._worker is not None:
+            provider._worker.close()
+
+
+class _FakeWorker:
+    """Worker stand-in that raises or replies as told."""
+
+    def __init__(self, outcome: Exception | subprocess.CompletedProcess[str]):
+        self.outcome = outcome
+        self.closed = False
+
+    def run(self, *_: object, **__: object) -> subprocess.CompletedProcess[str]:
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_command_not_rerun_after_worker_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a command is not run again once the worker may have run it."""
+    provider = CLIDataProvider()
+    worker = _FakeWorker(RuntimeError("CLI worker exited without replying"))
+    provider._worker = worker  # type: ignore[assignment]
+    monkeypatch.setattr(provider, "_get_worker", lambda: worker)
+
+    def fail_run(*_: object, **__: object) -> None:
+        raise AssertionError("the command must not run a second time")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    with pytest.raises(RuntimeError, match="Command execution failed"):
+        provider._run_command(["agents", "delete", "agent-1", "--yes"], use_cache=False)
+
+    assert worker.closed
+    assert provider._worker is None
+    assert provider.use_worker is True
+
+
+def test_request_retried_when_worker_stopped_before_sending(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a request reaching a stopped worker is sent to a new one."""
+    provider = CLIDataProvider()
+    done = subprocess.CompletedProcess(["agents", "list"], 0, "{}", "")
+    workers = iter([_FakeWorker(_WorkerStoppedError("stopped")), _FakeWorker(done)])
+    monkeypatch.setattr(provider, "_get_worker", lambda: next(workers))
+
+    assert provider._run_in_worker(["agents", "list"]) is done
+    assert provider.use_worker is True
+
+
+def test_command_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that cached command results are reused until the cache TTL passes."""
+    provider = CLIDataProvider()
+    calls: list[list[str]] = []
+
+    def run_in_worker(cmd_parts: list[str]) -> subprocess.CompletedProcess[str]:
+        calls.append(cmd_parts)
+        return subprocess.CompletedProcess(cmd_parts, 0, '{"models": []}', "")
+
+    now = 1000.0
+    monkeypatch.setattr(provider, "_run_in_worker", run_in_worker)
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    provider._run_command(["resources", "models"])
+    provider._run_command(["resources", "models"])
+    assert len(calls) == 1
+
+    now += CLIDataProvider.CACHE_TTL
+    assert provider._run_command(["resources", "models"]) == {"models": []}
+    assert len(calls) == 2
+
+
+def test_failed_command_output_not_parsed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a failing command raises without parsing its output."""
+    provider = CLIDataProvider()
+    failed = subprocess.CompletedProcess(["agents", "list"], 1, '{"agents": []}', "boom")
+    monkeypatch.setattr(provider, "_run_in_worker", lambda _cmd_parts: failed)
+
+    def fail_parse(*_: object, **__: object) -> None:
+        raise AssertionError("output of a failed command must not be parsed")
+
+    monkeypatch.setattr(cli_data_provider, "extract_json_from_text", fail_parse)
+
+    with pytest.raises(RuntimeError, match="Command failed with code 1: boom"):
+        provider._run_command(["agents", "list"])
+
+
+def test_clear_cache_keeps_cache_identity() -> None:
+    """Test that clear_cache empties the existing cache dict instead of replacing it."""
+    provider = CLIDataProvider()
+    cache = provider.cache
+    cache["agents list"] = (0.0, {"agents": []})
+
+    provider.clear_cache()
+
+    assert provider.cache is cache
+    assert not cache
+
+
+def test_resource_fallbacks_when_command_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that resource lists fall back to the shared defaults when the CLI fails."""
+    provider = CLIDataProvider()
+
+    def fail(*_: object, **__: object) -> dict:
+        raise RuntimeError("CLI unavailable")
+
+    monkeypatch.setattr(provider, "_run_command", fail)
+
+    models = provider.get_models()
+    assert [m.id for m in models.models] == [m.id for m in cli_data_provider.FALLBACK_MODELS]
+    assert models.pagination.total_items == len(cli_data_provider.FALLBACK_MODELS)
+
+    guardrails = provider.get_guardrails()
+    assert [g.name for g in guardrails.guardrails] == ["moderation", "pii-detection"]
+
+    agent_types = provider.get_agent_types()
+    assert [t.type for t in agent_types.agent_types] == ["tool", "rag", "task"]
+
+    # Callers get their own list, so the shared defaults cannot be altered
+    models.models.clear()
+    assert provider.get_models().models
+
+
+@pytest.mark.parametrize(("agent_type", "option"), [("chat", "--message"), ("task", "--task")])
+def test_invoke_agent_passes_message_verbatim(
+    monkeypatch: pytest.MonkeyPatch, agent_type: str, option: str
+) -> None:
+    """Test that the message reaches the CLI as a single, unquoted argument."""
+    provider = CLIDataProvider()
+    calls: list[list[str]] = []
+
+    def run_command(cmd_parts: list[str], **_: object) -> dict:
+        calls.append(cmd_parts)
+        return {"response": "ok"}
+
+    monkeypatch.setattr(provider, "_run_command", run_command)
+    message = """it's "hello world" $HOME"""
+
+    assert provider.invoke_agent("agent-1", message, agent_type).answer == "ok"
+    assert calls == [["invoke", agent_type, "agent-1", option, message, "--format", "json"]]
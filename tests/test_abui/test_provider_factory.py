@@ -11,6 +11,7 @@ from ab_cli.abui.providers.cli_data_provider import CLIDataProvider
 from ab_cli.abui.providers.direct_data_provider import DirectDataProvider
 from ab_cli.abui.providers.mock_data_provider import MockDataProvider
 from ab_cli.abui.providers.provider_factory import get_data_provider
+from ab_cli.abui.utils.data_cache import provider_cache_key
 from ab_cli.config import load_config
 
 
@@ -208,3 +209,90 @@ def test_provider_inheritance_with_profile():
             f"This means provider inheritance from base config is broken!"
         )
         print(f"✓ Profile correctly inherits data_provider='direct' from base config")
+
+
+@pytest.fixture
+def restore_session_state():
+    """Restore the session state keys used by the provider factory after a test."""
+    keys = ("settings", "current_profile", "data_provider")
+    saved = {key: st.session_state[key] for key in keys if key in st.session_state}
+    yield
+    for key in keys:
+        st.session_state.pop(key, None)
+    for key, value in saved.items():
+        st.session_state[key] = value
+
+
+def test_provider_shared_for_same_config(restore_session_state):
+    """Test that providers are reused for the same configuration and profile."""
+    config_path = TEST_DATA_DIR / "config-provider-mock.yaml"
+    config = load_config(str(config_path))
+    st.session_state["settings"] = config
+    st.session_state["current_profile"] = "default"
+
+    with patch.dict(os.environ, {}, clear=True):
+        if "data_provider" in st.session_state:
+            del st.session_state.data_provider
+        first = get_data_provider(config)
+
+        # A new session (no provider in session state) gets the same instance
+        del st.session_state.data_provider
+        second = get_data_provider(config)
+
+        # Switching profile creates a separate provider
+        del st.session_state.data_provider
+        st.session_state["current_profile"] = "staging"
+        third = get_data_provider(config)
+
+    assert first is second
+    assert third is not first
+
+
+def test_cli_provider_kept_per_session(restore_session_state):
+    """Test that each session gets its own CLI provider, with its own worker and cache."""
+    config = load_config(str(TEST_DATA_DIR / "config-provider-cli.yaml"))
+    st.session_state["settings"] = config
+    st.session_state["current_profile"] = "default"
+
+    with patch.dict(os.environ, {}, clear=True):
+        st.session_state.pop("data_provider", None)
+        first = get_data_provider(config)
+
+        # A new session (no provider in session state) gets a new instance
+        del st.session_state.data_provider
+        second = get_data_provider(config)
+
+    assert isinstance(first, CLIDataProvider)
+    assert isinstance(second, CLIDataProvider)
+    assert first is not second
+
+
+def test_provider_cache_key_follows_config(restore_session_state):
+    """Test that cached lookups are keyed on the provider configuration, not identity."""
+    config = load_config(str(TEST_DATA_DIR / "config-provider-cli.yaml"))
+    st.session_state["settings"] = config
+    st.session_state["current_profile"] = "default"
+
+    with patch.dict(os.environ, {}, clear=True):
+        st.session_state.pop("data_provider", None)
+        first = get_data_provider(config)
+        del st.session_state.data_provider
+        second = get_data_provider(config)
+
+        del st.session_state.data_provider
+        st.session_state["current_profile"] = "staging"
+        other_profile = get_data_provider(config)
+
+    assert first is not second
+    assert provider_cache_key(first) == provider_cache_key(second)
+    assert provider_cache_key(first).startswith("cli:")
+    assert provider_cache_key(other_profile) != provider_cache_key(first)
+
+
+def test_provider_cache_key_unique_outside_factory():
+    """Test that providers not built by the factory get a stable key of their own."""
+    first = MockDataProvider()
+    second = MockDataProvider()
+
+    assert provider_cache_key(first) == provider_cache_key(first)
+    assert provider_cache_key(first) != provider_cache_key(second)
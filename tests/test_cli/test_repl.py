@@ -0,0 +1,60 @@
+"""Tests for the hidden 'ab repl' command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from ab_cli.cli.main import main
+
+# Test data directory
+TEST_DATA_DIR = Path(__file__).parent.parent / "data" / "profiles"
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a CLI test runner."""
+    return CliRunner()
+
+
+def run_repl(runner: CliRunner, requests: list[str], args: list[str] | None = None) -> list[dict]:
+    """Send request lines to 'ab repl' and return the decoded replies."""
+    result = runner.invoke(main, [*(args or []), "repl"], input="\n".join(requests) + "\n")
+    assert result.exit_code == 0
+    return [json.loads(line) for line in result.output.splitlines()]
+
+
+class TestRepl:
+    """Tests for 'ab repl' command."""
+
+    def test_one_reply_per_request(self, runner: CliRunner) -> None:
+        """Test that each request gets a single JSON reply with the command output."""
+        replies = run_repl(runner, [json.dumps(["--version"]), json.dumps(["--version"])])
+
+        assert len(replies) == 2
+        assert replies[0]["returncode"] == 0
+        assert "version" in replies[0]["stdout"]
+
+    def test_failed_command(self, runner: CliRunner) -> None:
+        """Test that usage errors are reported in the reply, not by exiting the REPL."""
+        replies = run_repl(runner, [json.dumps(["no-such-command"]), json.dumps(["--version"])])
+
+        assert replies[0]["returncode"] == 2
+        assert "No such command" in replies[0]["stderr"]
+        assert replies[1]["returncode"] == 0
+
+    def test_invalid_request(self, runner: CliRunner) -> None:
+        """Test that a request that is not a JSON array is rejected."""
+        replies = run_repl(runner, ["agents list", json.dumps({"args": []})])
+
+        assert [reply["returncode"] for reply in replies] == [2, 2]
+        assert all("Invalid request" in reply["stderr"] for reply in replies)
+
+    def test_global_options_apply_to_requests(self, runner: CliRunner) -> None:
+        """Test that --config given to the REPL is used by every request."""
+        config_path = str(TEST_DATA_DIR / "config-with-profiles.yaml")
+        replies = run_repl(runner, [json.dumps(["profiles", "list"])], ["--config", config_path])
+
+        assert replies[0]["returncode"] == 0
+        assert "Found 3 profile(s)" in replies[0]["stdout"]
@@ -0,0 +1,33 @@
+"""Tests for the UI's on-disk chat history."""
+
+from pathlib import Path
+
+from ab_cli.abui.utils.chat_history import append_message, history_path, load_messages
+
+
+class TestChatHistory:
+    """Tests for saving and loading chat history."""
+
+    def test_append_and_load(self, tmp_path: Path) -> None:
+        """Test that appended messages are loaded back in order."""
+        directory = tmp_path / "history"
+        messages = [
+            {"role": "user", "content": "Hello 世界"},
+            {"role": "assistant", "content": "Hi!\nHow can I help?", "metadata": {"model": "m"}},
+        ]
+
+        for message in messages:
+            append_message(directory, "agent-1", message)
+
+        assert history_path(directory, "agent-1").read_text(encoding="utf-8").count("\n") == 2
+        assert load_messages(directory, "agent-1", limit=10) == messages
+        assert load_messages(directory, "agent-2", limit=10) == []
+
+    def test_load_keeps_latest_messages(self, tmp_path: Path) -> None:
+        """Test that only the last messages up to the limit are loaded."""
+        for i in range(5):
+            append_message(tmp_path, "agent-1", {"role": "user", "content": f"Message {i}"})
+
+        loaded = load_messages(tmp_path, "agent-1", limit=2)
+
+        assert [m["content"] for m in loaded] == ["Message 3", "Message 4"]
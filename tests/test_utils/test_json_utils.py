@@ -1,11 +1,18 @@
 """Tests for JSON utility functions."""
 
+import json
 import os
 from pathlib import Path
 
 import pytest
 
-from ab_cli.abui.utils.json_utils import extract_json_from_text, extract_text_from_object, format_json
+from ab_cli.abui.utils import json_utils
+from ab_cli.abui.utils.json_utils import (
+    extract_json_from_text,
+    extract_text_from_object,
+    format_json,
+    loads,
+)
 
 
 # Get the test data directory
@@ -159,6 +166,41 @@ class TestExtractJsonFromText:
         assert result["message"] == "Hello 世界"
         assert result["emoji"] == "🎉"
 
+    def test_braces_inside_strings(self):
+        """Test that braces inside JSON strings do not confuse the extraction."""
+        text = 'Debug: {not json\n{"message": "use } and { freely", "items": ["]"]}\n'
+        result = extract_json_from_text(text)
+
+        assert result == {"message": "use } and { freely", "items": ["]"]}
+
+    def test_prefers_largest_json(self):
+        """Test that a later, larger JSON object wins over an earlier small one."""
+        text = '[1]\nlog line\n{"agents": [{"id": 1}], "total": 1}\n{"a": 2}'
+        result = extract_json_from_text(text)
+
+        assert result == {"agents": [{"id": 1}], "total": 1}
+
+
+class TestLoads:
+    """Tests for loads function."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_loads(self, monkeypatch, use_orjson):
+        """Test parsing with and without the optional orjson parser."""
+        if not use_orjson:
+            monkeypatch.setattr(json_utils, "_orjson", None)
+        elif json_utils._orjson is None:
+            pytest.skip("orjson is not installed")
+
+        assert loads('{"message": "Hello 世界", "items": [1, 2.5, null]}') == {
+            "message": "Hello 世界",
+            "items": [1, 2.5, None],
+        }
+        assert loads(b"[true]") == [True]
+
+        with pytest.raises(json.JSONDecodeError):
+            loads('{"broken": }')
+
 
 class TestExtractTextFromObject:
     """Tests for extract_text_from_object function."""
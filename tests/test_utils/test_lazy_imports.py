@@ -0,0 +1,18 @@
+"""Tests for lazy import helpers."""
+
+from ab_cli.abui.utils.lazy_imports import get_pandas
+
+
+class TestGetPandas:
+    """Tests for get_pandas function."""
+
+    def test_returns_pandas_module(self):
+        """Test that the pandas module is returned."""
+        pd = get_pandas()
+
+        assert pd.__name__ == "pandas"
+        assert hasattr(pd, "DataFrame")
+
+    def test_returns_same_module_instance(self):
+        """Test that repeated calls reuse the imported module."""
+        assert get_pandas() is get_pandas()